@@ -33,11 +33,15 @@ import sys
 import os
 import json
 import subprocess
+import shutil
 import time
 import re
 import ctypes
 import zipfile
 import difflib
+import bisect
+import concurrent.futures
+from collections import defaultdict
 import hashlib
 import io
 import errno
@@ -48,6 +52,68 @@ import urllib.request
 import urllib.parse
 from pathlib import Path
 
+# Image extensions handled by the sorter. Tail checks use this tuple with
+# str.endswith, which is far cheaper than running the regex engine per line.
+_IMG_EXTS = ('.png', '.jpg', '.jpeg', '.webp', '.bmp', '.tga')
+
+# Folder names that never denote a skin; consulted in the hot skin filter.
+_IGNORED_SKIN_FOLDERS = frozenset({'images', 'common', 'assets', 'source', 'root', 'skeleton', 'jpeg', 'png', 'reference'})
+
+# 1x1 fully transparent PNG written for sequence/placeholder attachments with
+# no source file; a byte constant beats re-encoding an image per placeholder.
+_PLACEHOLDER_PNG = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82'
+
+# Trailing-digit capture used when ordering sequence frames; compiled once
+# instead of per lookup inside find_source_image's sort key.
+_TRAILING_DIGITS = re.compile(r'(\d+)$')
+_STRIP_SEQ_SUFFIX = re.compile(r'[_\-]?\d+$')
+
+# Byte-level patterns for fetched changelog pages: scanning the raw response
+# avoids decoding multi-MB HTML just to pull short ASCII tokens out of it.
+_VER_RE_B = re.compile(rb'\b(\d+\.\d+(?:\.\d+)?)\b')
+
+# Version-string patterns shared by the detection helpers; compiled once
+# instead of per call.
+_VER_RE = re.compile(r"(\d+\.\d+(?:\.\d+)?)")
+_VER_RE_STRICT = re.compile(r"\d+\.\d+(\.\d+)?")
+_VER_WORD_RE = re.compile(r"\b(\d+\.\d+(?:\.\d+)?)\b")
+_VER_BETA_RE = re.compile(r"\b(\d+\.\d+(?:\.\d+)?(?:-beta)?)\b", re.IGNORECASE)
+
+# Win32 version-info API, resolved once at import: attribute access on
+# ctypes.windll re-resolves the function every call, and the struct class
+# body would otherwise be re-executed per probed executable.
+_GetFileVersionInfoSize = None
+if os.name == 'nt':
+	try:
+		class _VS_FIXEDFILEINFO(ctypes.Structure):
+			_fields_ = [
+				("dwSignature", ctypes.c_uint32), ("dwStrucVersion", ctypes.c_uint32),
+				("dwFileVersionMS", ctypes.c_uint32), ("dwFileVersionLS", ctypes.c_uint32),
+				("dwProductVersionMS", ctypes.c_uint32), ("dwProductVersionLS", ctypes.c_uint32),
+				("dwFileFlagsMask", ctypes.c_uint32), ("dwFileFlags", ctypes.c_uint32),
+				("dwFileOS", ctypes.c_uint32), ("dwFileType", ctypes.c_uint32),
+				("dwFileSubtype", ctypes.c_uint32), ("dwFileDateMS", ctypes.c_uint32),
+				("dwFileDateLS", ctypes.c_uint32),
+			]
+
+		_win_ver = ctypes.windll.version
+		_GetFileVersionInfoSize = _win_ver.GetFileVersionInfoSizeW
+		_GetFileVersionInfoSize.argtypes = [ctypes.c_wchar_p, ctypes.c_void_p]
+		_GetFileVersionInfoSize.restype = ctypes.c_uint32
+		_GetFileVersionInfo = _win_ver.GetFileVersionInfoW
+		_GetFileVersionInfo.argtypes = [ctypes.c_wchar_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p]
+		_GetFileVersionInfo.restype = ctypes.c_int
+		_VerQueryValue = _win_ver.VerQueryValueW
+		_VerQueryValue.argtypes = [ctypes.c_void_p, ctypes.c_wchar_p, ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_uint)]
+		_VerQueryValue.restype = ctypes.c_int
+	except Exception:
+		_GetFileVersionInfoSize = None
+_MONTHLY_RE_B = re.compile(rb'href=["\']([^"\']*spine-changelog/\d{4}/\d{2}[^"\']*)', re.IGNORECASE)
+_MONTHLY_RE = re.compile(r'href=["\']([^"\']*spine-changelog/\d{4}/\d{2}[^"\']*)', re.IGNORECASE)
+
+# Last-ditch image-ref scrape when a skeleton JSON fails to parse.
+_IMG_REF_RE = re.compile(r'([\w\-/\\]+\.(?:png|jpg|jpeg|webp|bmp|tga))', re.IGNORECASE)
+
 # --- Configuration Constants ---
 # Default Spine versions for the version selector dropdown.
 # These act as fallbacks or common presets.
@@ -74,6 +140,35 @@ try:
 except Exception:
 	Image = None
 
+try:
+	# Optional: much faster C JSON codec for the large skeleton files.
+	import orjson
+except Exception:
+	orjson = None
+
+try:
+	# Optional: streaming JSON parser; lets the package diagnostics pull
+	# just the sections they read instead of materializing whole skeletons.
+	import ijson
+except Exception:
+	ijson = None
+
+
+def _jload(fh):
+	"""Parses JSON from an open file, using orjson when available."""
+	if orjson is not None:
+		return orjson.loads(fh.read())
+	return json.load(fh)
+
+try:
+	import requests
+	# Shared session: keep-alive avoids a fresh TCP+TLS handshake per
+	# changelog page when crawling versions from the web.
+	_HTTP_SESSION = requests.Session()
+except Exception:
+	requests = None
+	_HTTP_SESSION = None
+
 # --- GUI Dependencies ---
 # We wrap this in a try-block to provide a clear error message if PySide6 is missing.
 try:
@@ -194,29 +289,30 @@ class VersionFetcherThread(QThread):
 					continue
 				
 				# Grab direct versions listed (including -beta)
-				for v in re.findall(r"\b(\d+\.\d+(?:\.\d+)?(?:-beta)?)\b", html, re.IGNORECASE):
+				for v in _VER_BETA_RE.findall(html):
 					collected.add(v)
-				
+
 				# Grab monthly changelog links
-				for m in re.findall(r'href=["\']([^"\']*spine-changelog/\d{4}/\d{2}[^"\']*)', html, flags=re.IGNORECASE):
+				for m in _MONTHLY_RE.findall(html):
 					u = urllib.parse.urljoin(base, m)
 					if u not in monthly_urls:
 						monthly_urls.append(u)
 			
 			# 2. Fetch from Monthly URLs (limit to recent/all depending on speed)
-			# To be safe, we just fetch them. This might take a few seconds.
-			for mu in monthly_urls:
-				h = fetch_url(mu, timeout=5)
-				if h:
-					for v in re.findall(r"\b(\d+\.\d+(?:\.\d+)?(?:-beta)?)\b", h, re.IGNORECASE):
-						collected.add(v)
+			# Latency-bound, so fetch them concurrently instead of one by one.
+			if monthly_urls:
+				with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(monthly_urls))) as ex:
+					for h in ex.map(lambda mu: fetch_url(mu, timeout=5), monthly_urls):
+						if h:
+							for v in _VER_BETA_RE.findall(h):
+								collected.add(v)
 						
 			# 3. Always try root changelog too
 			try:
 				root_url = 'https://hr.esotericsoftware.com/spine-changelog/'
 				r = fetch_url(root_url)
 				if r:
-					for v in re.findall(r"\b(\d+\.\d+(?:\.\d+)?)\b", r):
+					for v in _VER_WORD_RE.findall(r):
 						collected.add(v)
 			except:
 				pass
@@ -228,7 +324,7 @@ class VersionFetcherThread(QThread):
 					parts.append(0)
 				return tuple(parts)
 
-			valid_versions = {v for v in collected if re.match(r'^\d+\.\d+(?:\.\d+)?$', v)}
+			valid_versions = {v for v in collected if _VER_RE_STRICT.fullmatch(v)}
 			sorted_versions = sorted(valid_versions, key=ver_key, reverse=True)
 			
 			self.versions_fetched.emit(sorted_versions)
@@ -254,33 +350,18 @@ class SpineScannerThread(QThread):
 		self.default_spine_exe = default_spine_exe
 
 	def _get_file_version_windows(self, path):
-		if os.name != 'nt':
+		if _GetFileVersionInfoSize is None:
 			return None
 		try:
-			GetFileVersionInfoSize = ctypes.windll.version.GetFileVersionInfoSizeW
-			GetFileVersionInfo = ctypes.windll.version.GetFileVersionInfoW
-			VerQueryValue = ctypes.windll.version.VerQueryValueW
-			
 			filename = str(path)
-			size = GetFileVersionInfoSize(filename, None)
+			size = _GetFileVersionInfoSize(filename, None)
 			if not size: return None
 			res = ctypes.create_string_buffer(size)
-			if not GetFileVersionInfo(filename, 0, size, res): return None
+			if not _GetFileVersionInfo(filename, 0, size, res): return None
 			r = ctypes.c_void_p()
 			l = ctypes.c_uint()
-			if not VerQueryValue(res, "\\", ctypes.byref(r), ctypes.byref(l)): return None
-			class VS_FIXEDFILEINFO(ctypes.Structure):
-				_fields_ = [
-					("dwSignature", ctypes.c_uint32), ("dwStrucVersion", ctypes.c_uint32),
-					("dwFileVersionMS", ctypes.c_uint32), ("dwFileVersionLS", ctypes.c_uint32),
-					("dwProductVersionMS", ctypes.c_uint32), ("dwProductVersionLS", ctypes.c_uint32),
-					("dwFileFlagsMask", ctypes.c_uint32), ("dwFileFlags", ctypes.c_uint32),
-					("dwFileOS", ctypes.c_uint32), ("dwFileType", ctypes.c_uint32),
-					("dwFileSubtype", ctypes.c_uint32), ("dwFileDateMS", ctypes.c_uint32),
-					("dwFileDateLS", ctypes.c_uint32),
-				]
-			
-			ffi = ctypes.cast(r, ctypes.POINTER(VS_FIXEDFILEINFO)).contents
+			if not _VerQueryValue(res, "\\", ctypes.byref(r), ctypes.byref(l)): return None
+			ffi = ctypes.cast(r, ctypes.POINTER(_VS_FIXEDFILEINFO)).contents
 			major = ffi.dwFileVersionMS >> 16
 			minor = ffi.dwFileVersionMS & 0xFFFF
 			patch = ffi.dwFileVersionLS >> 16
@@ -304,7 +385,7 @@ class SpineScannerThread(QThread):
 				try:
 					with open(txt_path, 'r', encoding='utf-8') as f:
 						content = f.read().strip()
-						if re.match(r"^\d+\.\d+(\.\d+)?$", content):
+						if _VER_RE_STRICT.fullmatch(content):
 							return content
 				except Exception:
 					pass
@@ -316,13 +397,12 @@ class SpineScannerThread(QThread):
 			binary = os.path.join(exe, "Contents", "MacOS", "Spine")
 			if os.path.exists(binary):
 				candidates = [[binary, '--version']]
-		ver_re = re.compile(r"(\d+\.\d+(?:\.\d+)?)")
 		for cmd in candidates:
 			try:
 				creationflags = 0x08000000 if os.name == 'nt' else 0
 				p = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, creationflags=creationflags)
 				out = (p.stdout or "") + "\n" + (p.stderr or "")
-				m = ver_re.search(out)
+				m = _VER_RE.search(out)
 				if m:
 					return m.group(1)
 			except Exception:
@@ -354,23 +434,30 @@ class SpineScannerThread(QThread):
 			if not root or not os.path.isdir(root):
 				continue
 			try:
-				for name in os.listdir(root):
-					if 'spine' in name.lower():
+				# scandir's DirEntry reuses the dirent type from readdir, so
+				# classifying candidates needs no extra stat per entry.
+				with os.scandir(root) as it:
+					for entry in it:
+						name = entry.name
+						low = name.lower()
+						if 'spine' not in low:
+							continue
 						if sys.platform == 'darwin' and name.endswith('.app'):
-							exe = os.path.join(root, name)
-							if os.path.isdir(exe) and exe not in seen:
+							exe = entry.path
+							if entry.is_dir() and exe not in seen:
 								candidates.append(exe); seen.add(exe)
 						else:
 							# Check for Spine.exe inside (standard)
-							exe = os.path.join(root, name, 'Spine.exe')
-							if os.path.isfile(exe) and exe not in seen:
-								candidates.append(exe); seen.add(exe)
-						
+							if entry.is_dir():
+								exe = os.path.join(entry.path, 'Spine.exe')
+								if os.path.isfile(exe) and exe not in seen:
+									candidates.append(exe); seen.add(exe)
+
 							# Also check if the folder itself contains the exe directly (rare but possible flat structure)
 							# e.g. root/Spine.exe
-							if name.lower() == 'spine.exe':
-								exe = os.path.join(root, name)
-								if os.path.isfile(exe) and exe not in seen:
+							if low == 'spine.exe' and entry.is_file():
+								exe = entry.path
+								if exe not in seen:
 									candidates.append(exe); seen.add(exe)
 
 			except Exception:
@@ -388,13 +475,27 @@ class SpineScannerThread(QThread):
 						candidates.append(exe); seen.add(exe)
 			except Exception:
 				pass
+		# Version detection spawns a subprocess per candidate with a 1s
+		# timeout; probe them concurrently so the wait is the slowest
+		# candidate rather than the sum of all of them.
+		def _safe_detect(exe):
+			try:
+				return self.detect_spine_version(exe)
+			except Exception:
+				return None
+
+		versions = {}
+		if candidates:
+			try:
+				with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(candidates))) as ex:
+					versions = dict(zip(candidates, ex.map(_safe_detect, candidates)))
+			except Exception:
+				versions = {exe: _safe_detect(exe) for exe in candidates}
+
 		results = []
 		for exe in candidates:
 			label = os.path.basename(os.path.dirname(exe)) or os.path.basename(exe)
-			try:
-				ver = self.detect_spine_version(exe)
-			except Exception:
-				ver = None
+			ver = versions.get(exe)
 			if ver:
 				disp = f"{label} ({ver}) - {os.path.basename(exe)}"
 			else:
@@ -464,8 +565,23 @@ class ImageCache:
 	def __init__(self, cache_path):
 		self.cache_path = cache_path
 		self.cache = {}
+		# Short-lived stat results so a get/set pair (or repeated gets in one
+		# scan batch) costs a single stat syscall.
+		self._stat_cache = {}  # path -> (monotonic_ts, stat_result)
+		self._stat_ttl = 2.0
+		self._dirty = False
 		self.load()
 
+	def _stat(self, path):
+		"""Returns os.stat(path), coalescing repeated calls within a short TTL."""
+		now = time.monotonic()
+		cached = self._stat_cache.get(path)
+		if cached is not None and (now - cached[0]) < self._stat_ttl:
+			return cached[1]
+		stat = os.stat(path)
+		self._stat_cache[path] = (now, stat)
+		return stat
+
 	def load(self):
 		"""Loads the cache from the JSON file."""
 		try:
@@ -476,39 +592,50 @@ class ImageCache:
 			self.cache = {}
 
 	def save(self):
-		"""Saves the current cache state to the JSON file."""
+		"""Saves the current cache state to the JSON file if it changed."""
+		if not self._dirty:
+			return
 		try:
-			with open(self.cache_path, 'w', encoding='utf-8') as f:
-				json.dump(self.cache, f, indent=2)
+			# Machine-written cache: compact separators keep serialization and
+			# the file itself small, and tmp+os.replace makes the write atomic.
+			tmp = self.cache_path + '.tmp'
+			with open(tmp, 'w', encoding='utf-8') as f:
+				json.dump(self.cache, f, separators=(',', ':'))
+			os.replace(tmp, self.cache_path)
+			self._dirty = False
 		except Exception:
 			pass
 
 	def get(self, path):
 		"""
 		Retrieves data for a file if the cache is valid (mtime/size match).
+
+		Returns (data_or_None, stat_or_None); the stat can be handed back to
+		set() so a miss-then-store round trip stats the file only once.
 		"""
 		try:
-			stat = os.stat(path)
-			mtime = stat.st_mtime
-			size = stat.st_size
-			
+			stat = self._stat(path)
+
 			if path in self.cache:
 				entry = self.cache[path]
-				if entry.get('mtime') == mtime and entry.get('size') == size:
-					return entry.get('data')
+				if entry.get('mtime') == stat.st_mtime and entry.get('size') == stat.st_size:
+					return entry.get('data'), stat
+			return None, stat
 		except Exception:
 			pass
-		return None
+		return None, None
 
-	def set(self, path, data):
-		"""Updates or adds an entry to the cache."""
+	def set(self, path, data, stat=None):
+		"""Updates or adds an entry to the cache. Reuses a pre-fetched stat if given."""
 		try:
-			stat = os.stat(path)
+			if stat is None:
+				stat = self._stat(path)
 			self.cache[path] = {
 				'mtime': stat.st_mtime,
 				'size': stat.st_size,
 				'data': data
 			}
+			self._dirty = True
 		except Exception:
 			pass
 
@@ -518,10 +645,35 @@ class FileScanner:
 	Recursively scans directories for files.
 
 	Results are cached in memory for the lifetime of the object to avoid
-	re-scanning the file system unnecessarily.
+	re-scanning the file system unnecessarily. When a cache_path is given,
+	listings are also persisted to disk and reused across launches as long
+	as the top-level directory mtime is unchanged.
 	"""
-	def __init__(self):
+	def __init__(self, cache_path=None):
 		self.cache = {} # dir_path -> list of (full_path, basename_lower)
+		self.cache_path = cache_path
+		self._disk_cache = {} # dir_path -> {"mtime_ns": int, "entries": [[path, lower], ...]}
+		self._dirty = False
+		if cache_path:
+			try:
+				if os.path.exists(cache_path):
+					with open(cache_path, 'r', encoding='utf-8') as f:
+						self._disk_cache = json.load(f)
+			except Exception:
+				self._disk_cache = {}
+
+	def save(self):
+		"""Persists the disk cache if anything changed since load."""
+		if not self.cache_path or not self._dirty:
+			return
+		try:
+			tmp = self.cache_path + '.tmp'
+			with open(tmp, 'w', encoding='utf-8') as f:
+				json.dump(self._disk_cache, f, separators=(',', ':'))
+			os.replace(tmp, self.cache_path)
+			self._dirty = False
+		except Exception:
+			pass
 
 	def scan(self, directory):
 		"""
@@ -535,14 +687,57 @@ class FileScanner:
 		"""
 		if directory in self.cache:
 			return self.cache[directory]
-		
+
+		# Warm-launch path: reuse the persisted listing only when none of the
+		# directories the previous walk visited has changed. Edits inside a
+		# subdirectory do not touch the root's mtime, so each recorded folder
+		# is re-stat'ed — one stat per directory, no readdir and no per-file
+		# work — before the cached entries are trusted.
+		dir_mtime_ns = None
+		try:
+			dir_mtime_ns = os.stat(directory).st_mtime_ns
+			entry = self._disk_cache.get(directory)
+			if entry and entry.get('mtime_ns') == dir_mtime_ns:
+				recorded = entry.get('dir_mtimes')
+				fresh = recorded is not None  # old cache format: treat as stale
+				if fresh:
+					for d, m in recorded.items():
+						try:
+							if os.stat(d).st_mtime_ns != m:
+								fresh = False
+								break
+						except OSError:
+							fresh = False
+							break
+				if fresh:
+					results = [tuple(e) for e in entry.get('entries', [])]
+					self.cache[directory] = results
+					return results
+		except Exception:
+			pass
+
 		results = []
+		dir_mtimes = {}
 		if directory and os.path.exists(directory):
-			for root, dirs, files in os.walk(directory):
-				for f in files:
-					full_path = os.path.join(root, f)
-					results.append((full_path, f.lower()))
+			# Iterative scandir walk: DirEntry carries the d_type from
+			# readdir, so classifying entries needs no extra stat per file.
+			stack = [directory]
+			while stack:
+				d = stack.pop()
+				try:
+					dir_mtimes[d] = os.stat(d).st_mtime_ns
+					with os.scandir(d) as it:
+						for e in it:
+							if e.is_dir(follow_symlinks=False):
+								stack.append(e.path)
+							elif e.is_file(follow_symlinks=False):
+								results.append((e.path, e.name.lower()))
+				except OSError:
+					pass
 		self.cache[directory] = results
+		if self.cache_path and dir_mtime_ns is not None:
+			self._disk_cache[directory] = {'mtime_ns': dir_mtime_ns, 'dir_mtimes': dir_mtimes, 'entries': [list(r) for r in results]}
+			self._dirty = True
 		return results
 
 
@@ -550,60 +745,100 @@ class SpinePackageValidator:
 	"""Deep diagnostic tool for .spine packages."""
 	
 	@staticmethod
-	def diagnose(spine_path, log_callback=print):
+	def diagnose(spine_path, log_callback=print, cache=None):
 		log_callback(f"Diagnosing: {spine_path}")
 		if not os.path.exists(spine_path):
 			log_callback("ERROR: File not found.")
 			return
 
-		if not zipfile.is_zipfile(spine_path):
-			# Check if it might be a binary Spine file
+		# Repeated diagnoses of an unchanged file (mtime/size match) can skip
+		# the whole decompression/verification pass when a prior run was clean.
+		cached_stat = None
+		if cache is not None:
 			try:
-				with open(spine_path, 'rb') as f:
-					header = f.read(8)
-					if len(header) > 0:
-						log_callback("INFO: File is not a ZIP archive. It appears to be a binary .spine file (standard format).")
-						log_callback("Diagnostic checks for ZIP structure skipped.")
-						return
+				prior, cached_stat = cache.get(spine_path)
+				if prior and prior.get('ok'):
+					log_callback("Cached clean result (file unchanged). Skipping deep checks.")
+					return True
 			except Exception:
-				pass
-				
+				cached_stat = None
+
+		# One open serves both the magic sniff and the central-directory
+		# parse; zipfile.is_zipfile would scan the file tail only for ZipFile
+		# to reopen and seek the same file again.
+		fh = None
+		header = None
+		try:
+			fh = open(spine_path, 'rb')
+			header = fh.read(4)
+		except Exception:
+			if fh:
+				try: fh.close()
+				except Exception: pass
+			fh = None
+
+		if fh is None:
 			log_callback("ERROR: Not a valid ZIP file and could not be identified as a binary Spine file.")
 			return
 
+		if not header.startswith(b'PK'):
+			try: fh.close()
+			except Exception: pass
+			if len(header) > 0:
+				log_callback("INFO: File is not a ZIP archive. It appears to be a binary .spine file (standard format).")
+				log_callback("Diagnostic checks for ZIP structure skipped.")
+				return
+			log_callback("ERROR: Not a valid ZIP file and could not be identified as a binary Spine file.")
+			return
+
+		fh.seek(0)
+
 		issues = []
 		warnings = []
-		
+
 		try:
-			with zipfile.ZipFile(spine_path, 'r') as z:
+			with zipfile.ZipFile(fh, 'r') as z:
 				# 1. Check ZIP entries
-				names = z.namelist()
-				log_callback(f"ZIP contains {len(names)} entries.")
-				
-				# Check for duplicates (case-insensitive)
+				# NameToInfo is the dict the ZipFile already maintains over the
+				# central directory; it serves the O(1) membership tests below.
+				# The entry pass iterates infolist() instead: NameToInfo
+				# collapses byte-identical duplicate entries (last one wins),
+				# which would hide exactly the duplicates this pass reports.
+				names = z.NameToInfo
+				infos = z.infolist()
+				log_callback(f"ZIP contains {len(infos)} entries.")
+
+				# One pass over the entries builds every index used below:
+				# duplicate detection, the JSON candidates and the image list.
 				seen_lower = {}
-				for n in names:
+				jsons = []
+				image_names = []
+				for info in infos:
+					n = info.filename
 					lower = n.lower()
 					if lower in seen_lower:
 						warnings.append(f"Duplicate filename (case-insensitive): {n} vs {seen_lower[lower]}")
 					seen_lower[lower] = n
+					if lower.endswith('.json'):
+						jsons.append(n)
+					elif lower.endswith(('.png', '.jpg', '.jpeg', '.webp')):
+						image_names.append(n)
 
 				# 2. Find JSON
 				base_name = os.path.splitext(os.path.basename(spine_path))[0]
 				expected_json = base_name + ".json"
-				
+
 				json_entry = None
-				for n in names:
+				for n in jsons:
 					if n == expected_json:
 						json_entry = n
 						break
 					if n.lower() == expected_json.lower():
 						warnings.append(f"JSON name case mismatch: found '{n}', expected '{expected_json}'")
 						json_entry = n
-				
+
 				if not json_entry:
-					# Fallback: look for any json
-					jsons = [n for n in names if n.lower().endswith('.json')]
+					# Fallback: use any json found in the entry pass
 					if not jsons:
 						issues.append("CRITICAL: No JSON file found in archive.")
 						return
@@ -614,12 +849,29 @@ class SpinePackageValidator:
 
 				log_callback(f"Analyzing JSON: {json_entry}")
 				
-				try:
-					with z.open(json_entry) as f:
-						data = json.load(f)
-				except Exception as e:
-					issues.append(f"CRITICAL: Invalid JSON: {e}")
-					return
+				# The checks below only read 'skeleton' and 'skins'; with ijson
+				# available those sections are streamed out individually and the
+				# animation data (usually the bulk of the file) is never built.
+				data = None
+				if ijson is not None:
+					try:
+						with z.open(json_entry) as f:
+							skel_items = list(ijson.items(f, 'skeleton'))
+						with z.open(json_entry) as f:
+							skins_items = list(ijson.items(f, 'skins'))
+						data = {
+							'skeleton': skel_items[0] if skel_items else None,
+							'skins': skins_items[0] if skins_items else [],
+						}
+					except Exception:
+						data = None
+				if data is None:
+					try:
+						with z.open(json_entry) as f:
+							data = json.load(f)
+					except Exception as e:
+						issues.append(f"CRITICAL: Invalid JSON: {e}")
+						return
 
 				# 3. Check Skeleton
 				skel = data.get('skeleton')
@@ -671,44 +923,40 @@ class SpinePackageValidator:
 										process_skin(v)
 
 				log_callback(f"Found {len(attachment_paths)} attachment references.")
-				
-				# Verify paths
+
+				# Verify paths. Membership goes against the NameToInfo dict
+				# (list containment would make this O(attachments x entries)),
+				# and paths reused by several skins are resolved once.
 				missing_files = []
-				for p in attachment_paths:
+				exts_no_ext = ('.png', '.jpg', '.jpeg')
+				for p in dict.fromkeys(attachment_paths):
 					# Construct expected path in ZIP
 					# Spine joins skeleton.images + path + .png (if no extension)
 					# But here we assume the ZIP structure matches what we wrote: images/skeleton/family/...
-					
-					has_ext = os.path.splitext(p)[1] != ''
-					candidates = []
-					if has_ext:
-						candidates.append(p)
-					else:
-						candidates.append(p + ".png")
-						candidates.append(p + ".jpg")
-						candidates.append(p + ".jpeg")
-					
+					# Normalize separators once per path; candidates are then
+					# plain concatenations instead of os.path.join + replace.
+					p_norm = p.replace('\\', '/')
+					exts = ('',) if os.path.splitext(p_norm)[1] else exts_no_ext
+
 					found = False
-					for cand in candidates:
-						# Try with 'images/' prefix
-						try_paths = [
-							os.path.join('images', cand).replace('\\', '/'),
-							cand.replace('\\', '/') # In case path already includes images/
-						]
-						
-						for tp in try_paths:
+					for ext in exts:
+						cand = p_norm + ext
+						# Try with 'images/' prefix, then as-is (in case the
+						# path already includes images/)
+						for tp in ('images/' + cand, cand):
 							if tp in names:
 								found = True
 								break
 							# Case insensitive check
-							if tp.lower() in seen_lower:
+							tp_lower = tp.lower()
+							if tp_lower in seen_lower:
 								found = True
 								# Check for exact case match
-								if seen_lower[tp.lower()] != tp:
-									warnings.append(f"Case mismatch: JSON '{p}' -> '{tp}' vs ZIP '{seen_lower[tp.lower()]}'")
+								if seen_lower[tp_lower] != tp:
+									warnings.append(f"Case mismatch: JSON '{p}' -> '{tp}' vs ZIP '{seen_lower[tp_lower]}'")
 								break
 						if found: break
-					
+
 					if not found:
 						missing_files.append(p)
 
@@ -723,16 +971,34 @@ class SpinePackageValidator:
 				if Image:
 					log_callback("Checking image integrity...")
 					bad_images = []
-					for n in names:
-						if n.lower().endswith(('.png', '.jpg', '.jpeg', '.webp')):
-							try:
-								with z.open(n) as img_file:
-									# Read into memory to avoid seek issues with zip stream
-									buf = io.BytesIO(img_file.read())
-									with Image.open(buf) as im:
-										im.verify()
-							except Exception as e:
-								bad_images.append(f"{n}: {e}")
+					# Read each entry under the single archive handle (ZipFile
+					# reads are not thread-safe), then verify in a pool: Pillow
+					# releases the GIL for the png/jpeg decoders, so the
+					# per-image work actually runs in parallel.
+					payloads = []
+					for n in image_names:
+						try:
+							with z.open(n) as img_file:
+								# Read into memory to avoid seek issues with zip stream
+								payloads.append((n, img_file.read()))
+						except Exception as e:
+							bad_images.append(f"{n}: {e}")
+
+					def _verify(item):
+						n, raw = item
+						try:
+							with Image.open(io.BytesIO(raw)) as im:
+								im.verify()
+							return None
+						except Exception as e:
+							return f"{n}: {e}"
+
+					if payloads:
+						try:
+							with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as ex:
+								bad_images.extend(r for r in ex.map(_verify, payloads) if r)
+						except Exception:
+							bad_images.extend(r for r in map(_verify, payloads) if r)
 					
 					if bad_images:
 						issues.append(f"CRITICAL: {len(bad_images)} corrupt images found.")
@@ -743,6 +1009,9 @@ class SpinePackageValidator:
 
 		except Exception as e:
 			issues.append(f"CRITICAL: Error reading ZIP: {e}")
+		finally:
+			try: fh.close()
+			except Exception: pass
 
 		log_callback("\n--- DIAGNOSTIC REPORT ---")
 		if not issues and not warnings:
@@ -757,7 +1026,17 @@ class SpinePackageValidator:
 			log_callback(f"\nISSUES ({len(issues)}):")
 			for i in issues:
 				log_callback(f"- {i}")
-		
+
+		if cache is not None:
+			try:
+				cache.set(spine_path, {
+					'ok': len(issues) == 0,
+					'warnings': len(warnings),
+					'issues': len(issues),
+				}, stat=cached_stat)
+			except Exception:
+				pass
+
 		return len(issues) == 0
 
 
@@ -796,16 +1075,60 @@ class MainWindow(QMainWindow):
 		# Do NOT persist to disk here to avoid slow startup on some filesystems.
 		if "validate_only" not in self.config:
 			self.config["validate_only"] = False
+		# Persistent opacity-analysis cache keyed by path, with the file's
+		# mtime+size signature stored per entry (lives inside the config so
+		# it survives restarts). Editing a file replaces its slot, so the
+		# cache is bounded by the number of distinct images.
+		self._opacity_cache = self.config.setdefault("opacity_cache", {})
+		# Prune entries from the old path:mtime:size keying, which grew a new
+		# key per edit forever and bloated every config save.
+		_stale_opacity = [k for k, v in self._opacity_cache.items() if not (isinstance(v, dict) and 'sig' in v)]
+		for k in _stale_opacity:
+			del self._opacity_cache[k]
+		# Verbose per-reference resolution logging; every append crosses into
+		# the text widget and reflows it, so it's off unless debugging.
+		self.debug = bool(self.config.get("debug_logging", False))
 		
 		self.image_cache = ImageCache(self._make_cache_path())
+		# Write-back batching: set() only marks the cache dirty, so N updates
+		# during a run cost one periodic flush plus a final one on quit.
+		self._cache_flush_timer = QTimer(self)
+		self._cache_flush_timer.setInterval(30000)
+		self._cache_flush_timer.timeout.connect(self.image_cache.save)
+		self._cache_flush_timer.start()
+		try:
+			QApplication.instance().aboutToQuit.connect(self.image_cache.save)
+		except Exception:
+			pass
+
+		# Debounce config writes: slider drags fire valueChanged for every
+		# intermediate value, so coalesce them into a single save shortly
+		# after the last change instead of rewriting the file each tick.
+		self._save_timer = QTimer(self)
+		self._save_timer.setSingleShot(True)
+		self._save_timer.setInterval(300)
+		self._save_timer.timeout.connect(self._save_config)
+		# Flush a pending debounced save on quit, otherwise a change made
+		# within the 300ms window of closing the app is lost.
+		try:
+			QApplication.instance().aboutToQuit.connect(self._flush_pending_config_save)
+		except Exception:
+			pass
 
 		central = QWidget()
 		layout = QVBoxLayout()
 
-		# Start background scan
+		# Start background scan. Recent results are cached in the config so a
+		# warm launch fills the combo without re-walking Program Files; the
+		# Refresh button still forces a real rescan.
 		self.scanner_thread = SpineScannerThread(self.config, self.default_spine_exe, self)
 		self.scanner_thread.versions_found.connect(self.on_spine_versions_found)
-		self.scanner_thread.start()
+		cached_versions = self.config.get('spine_versions_cache') or []
+		cache_ts = self.config.get('spine_versions_cache_ts', 0)
+		if cached_versions and (time.time() - cache_ts) < 3600:
+			QTimer.singleShot(0, lambda: self.on_spine_versions_found([tuple(r) for r in cached_versions]))
+		else:
+			self.scanner_thread.start()
 		
 		self.available_spine_versions = [] # Populated by scanner thread
 
@@ -1292,7 +1615,7 @@ class MainWindow(QMainWindow):
 			if not content: return
 			
 			# Validate format X.Y.Z
-			if not re.match(r"^\d+\.\d+(\.\d+)?$", content):
+			if not _VER_RE_STRICT.fullmatch(content):
 				return
 
 			# Initialize disk read version if first time
@@ -1809,7 +2132,7 @@ class MainWindow(QMainWindow):
 		if path:
 			self.info_panel.clear()
 			# Use internal validator class instead of external script
-			SpinePackageValidator.diagnose(path, log_callback=self.info_panel.append)
+			SpinePackageValidator.diagnose(path, log_callback=self.info_panel.append, cache=self.image_cache)
 
 	def on_spine_versions_found(self, results):
 		"""Callback when background scan finishes."""
@@ -1853,9 +2176,25 @@ class MainWindow(QMainWindow):
 			results.append((label, sel))
 
 		self.available_spine_versions = results
+
+		# Persist for warm launches. The timestamp only moves when the list
+		# actually changed, so replaying the cached list doesn't keep the
+		# cache fresh forever.
+		try:
+			serialized = [list(r) for r in results]
+			if serialized != self.config.get('spine_versions_cache'):
+				self.config['spine_versions_cache'] = serialized
+				self.config['spine_versions_cache_ts'] = time.time()
+				self._save_timer.start()
+		except Exception:
+			pass
+
 		self.spine_combo.clear()
 		for disp, exe in results:
 			self.spine_combo.addItem(disp, exe)
+			# show the full executable path on hover without a second
+			# model-update pass over the combo afterwards
+			self.spine_combo.setItemData(self.spine_combo.count() - 1, exe, Qt.ToolTipRole)
 			
 		# Update all existing file list items with the new versions
 		for i in range(self.list_widget.count()):
@@ -1896,14 +2235,14 @@ class MainWindow(QMainWindow):
 	def _save_opacity_config(self, v):
 		try:
 			self.config["opacity_threshold"] = int(v)
-			self._save_config()
+			self._save_timer.start()
 		except Exception:
 			pass
 
 	def _save_alpha_config(self, v):
 		try:
 			self.config["alpha_cutoff"] = int(v)
-			self._save_config()
+			self._save_timer.start()
 		except Exception:
 			pass
 
@@ -1911,63 +2250,63 @@ class MainWindow(QMainWindow):
 		try:
 			# QCheckBox.stateChanged sends int; convert to bool
 			self.config["open_after_export"] = bool(v)
-			self._save_config()
+			self._save_timer.start()
 		except Exception:
 			pass
 
 	def _save_force_local_config(self, v):
 		try:
 			self.config["force_local_sorting"] = bool(v)
-			self._save_config()
+			self._save_timer.start()
 		except Exception:
 			pass
 
 	def _save_optimization_config(self, state):
 		try:
 			self.config['optimization_enabled'] = bool(state)
-			self._save_config()
+			self._save_timer.start()
 		except Exception:
 			pass
 
 	def _save_keep_temp_config(self, v):
 		try:
 			self.config["keep_temp_files"] = bool(v)
-			self._save_config()
+			self._save_timer.start()
 		except Exception:
 			pass
 
 	def _save_verbose_cleanup_config(self, v):
 		try:
 			self.config["verbose_cleanup_logging"] = bool(v)
-			self._save_config()
+			self._save_timer.start()
 		except Exception:
 			pass
 
 	def _save_pretty_print_config(self, v):
 		try:
 			self.config["pretty_print_json"] = bool(v)
-			self._save_config()
+			self._save_timer.start()
 		except Exception:
 			pass
 
 	def _save_json_only_config(self, v):
 		try:
 			self.config["json_export_only"] = bool(v)
-			self._save_config()
+			self._save_timer.start()
 		except Exception:
 			pass
 
 	def _save_smart_corners_config(self, v):
 		try:
 			self.config["smart_corner_detection"] = bool(v)
-			self._save_config()
+			self._save_timer.start()
 		except Exception:
 			pass
 
 	def _save_validate_only_config(self, v):
 		try:
 			self.config["validate_only"] = bool(v)
-			self._save_config()
+			self._save_timer.start()
 		except Exception:
 			pass
 
@@ -1975,38 +2314,64 @@ class MainWindow(QMainWindow):
 	def _save_similarity_confidence_config(self, v):
 		try:
 			self.config["similarity_confidence"] = int(v)
-			self._save_config()
+			self._save_timer.start()
 		except Exception:
 			pass
 
 	# export settings UI removed — using default export settings (no export JSON)
 
+	def _app_data_dir(self):
+		# Resolve the writable app dir once; the Qt lookup plus makedirs was
+		# previously repeated on every config/cache path request.
+		loc = getattr(self, "_app_dir", None)
+		if loc is None:
+			loc = QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation)
+			if not loc:
+				loc = os.path.join(os.path.expanduser("~"), ".pyside_spine_app")
+			os.makedirs(loc, exist_ok=True)
+			self._app_dir = loc
+		return loc
+
 	def _make_config_path(self):
-		loc = QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation)
-		if not loc:
-			loc = os.path.join(os.path.expanduser("~"), ".pyside_spine_app")
-		os.makedirs(loc, exist_ok=True)
-		return os.path.join(loc, "config.json")
+		return os.path.join(self._app_data_dir(), "config.json")
 
 	def _make_cache_path(self):
-		loc = QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation)
-		if not loc:
-			loc = os.path.join(os.path.expanduser("~"), ".pyside_spine_app")
-		os.makedirs(loc, exist_ok=True)
-		return os.path.join(loc, "image_cache.json")
+		return os.path.join(self._app_data_dir(), "image_cache.json")
+
+	def _make_scan_cache_path(self):
+		return os.path.join(self._app_data_dir(), "file_scan_cache.json")
 
 	def _load_config(self):
 		try:
 			if os.path.exists(self.config_path):
-				with open(self.config_path, "r", encoding="utf-8") as fh:
-					self.config = json.load(fh)
+				# Single read + parse; json.load's chunked file reading is
+				# slower than handing the codec one bytes object.
+				self.config = json.loads(Path(self.config_path).read_bytes())
 		except Exception:
 			self.config = {}
 
+	def _flush_pending_config_save(self):
+		# Quit-time companion to the debounce timer: write out a save that
+		# was scheduled but had not fired yet.
+		if self._save_timer.isActive():
+			self._save_timer.stop()
+			self._save_config()
+
 	def _save_config(self):
 		try:
-			with open(self.config_path, "w", encoding="utf-8") as fh:
-				json.dump(self.config, fh, indent=2)
+			# Serialize once and write in a single call; json.dump issues many
+			# tiny writes. Writing to a temp file + fsync + os.replace keeps
+			# the config intact if we crash mid-write.
+			if orjson is not None:
+				data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+			else:
+				data = json.dumps(self.config, indent=2).encode("utf-8")
+			tmp = self.config_path + ".tmp"
+			with open(tmp, "wb") as fh:
+				fh.write(data)
+				fh.flush()
+				os.fsync(fh.fileno())
+			os.replace(tmp, self.config_path)
 		except Exception as e:
 			QMessageBox.warning(self, "Save Error", f"Could not save config: {e}")
 
@@ -2302,10 +2667,27 @@ class MainWindow(QMainWindow):
 	# I'll redirect it to use the thread instance's method to avoid code duplication.
 	
 	def detect_spine_version(self, spine_exe, timeout=1.0):
-		return self.scanner_thread.detect_spine_version(spine_exe, timeout)
+		# Detection may spawn a subprocess, so memoize per executable keyed
+		# by its mtime; repeat lookups (combo changes, browse) become dict hits.
+		try:
+			st_key = os.stat(spine_exe).st_mtime_ns
+			cache = self.config.setdefault('version_cache', {})
+			cached = cache.get(spine_exe)
+			if cached and cached[0] == st_key and cached[1]:
+				return cached[1]
+			ver = self.scanner_thread.detect_spine_version(spine_exe, timeout)
+			if ver:
+				cache[spine_exe] = [st_key, ver]
+				self._save_timer.start()
+			return ver
+		except Exception:
+			return self.scanner_thread.detect_spine_version(spine_exe, timeout)
 
 	def scan_spine_versions(self):
 		"""Trigger a rescan via the background thread."""
+		# Drop the cached results so this is a real rescan, not a replay
+		self.config.pop('spine_versions_cache', None)
+		self.config.pop('spine_versions_cache_ts', None)
 		self.spine_combo.clear()
 		self.scanner_thread.start()
 
@@ -2314,7 +2696,7 @@ class MainWindow(QMainWindow):
 			val = self.spine_combo.currentData()
 			if val:
 				self.config['spine_exe_selected'] = val
-				self._save_config()
+				self._save_timer.start()
 		except Exception:
 			pass
 
@@ -2322,7 +2704,7 @@ class MainWindow(QMainWindow):
 		try:
 			if v:
 				self.config['spine_json_version'] = str(v)
-				self._save_config()
+				self._save_timer.start()
 		except Exception:
 			pass
 
@@ -2336,6 +2718,23 @@ class MainWindow(QMainWindow):
 		- Use SSL-unverified fallback and HTTP fallback for environments with broken cert bundles.
 		- Populate `json_version_combo` with deduped, semantically sorted versions.
 		"""
+		# Serve from the cached result when it is fresh (<24h); versions roll
+		# over rarely, so the common case needs no network at all. Holding
+		# Shift while clicking forces a re-crawl.
+		try:
+			cached = self.config.get('spine_version_cache_web')
+			force = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+			if cached and not force and time.time() - cached.get('ts', 0) < 86400:
+				existing = set(self.json_version_combo.itemText(i) for i in range(self.json_version_combo.count()))
+				added = 0
+				for v in cached.get('versions', []):
+					if v not in existing:
+						self.json_version_combo.addItem(v)
+						added += 1
+				self.info_panel.append(f'Loaded {len(cached.get("versions", []))} cached versions ({added} new); Shift-click to refresh')
+				return
+		except Exception:
+			pass
 		base_urls = [
 			'https://hr.esotericsoftware.com/spine-changelog/archive',
 			'https://esotericsoftware.com/spine-changelog/archive',
@@ -2344,18 +2743,34 @@ class MainWindow(QMainWindow):
 			import urllib.request, urllib.parse, ssl, re
 			self.info_panel.append(f'Fetching Spine versions from web (may try multiple hosts)')
 			def fetch_url(u, timeout=10):
+				# returns raw bytes; the byte-level regexes below scan the
+				# response directly so we never decode whole pages
+				# prefer the shared keep-alive session so TLS handshakes are
+				# amortized across the whole crawl
+				if _HTTP_SESSION is not None:
+					try:
+						r = _HTTP_SESSION.get(u, timeout=timeout)
+						r.raise_for_status()
+						return r.content
+					except Exception:
+						try:
+							r = _HTTP_SESSION.get(u, timeout=timeout, verify=False)
+							r.raise_for_status()
+							return r.content
+						except Exception:
+							pass
 				# try normal TLS, then unverified, then plain HTTP
 				last_err = None
 				try:
 					ctx = ssl.create_default_context()
 					with urllib.request.urlopen(u, timeout=timeout, context=ctx) as r:
-						return r.read().decode('utf-8', errors='ignore')
+						return r.read()
 				except Exception as e1:
 					last_err = e1
 					try:
 						ctx = ssl._create_unverified_context()
 						with urllib.request.urlopen(u, timeout=timeout, context=ctx) as r:
-							return r.read().decode('utf-8', errors='ignore')
+							return r.read()
 					except Exception as e2:
 						last_err = e2
 						# try HTTP fallback
@@ -2363,7 +2778,7 @@ class MainWindow(QMainWindow):
 							http_u = 'http://' + u[len('https://'):]
 							try:
 								with urllib.request.urlopen(http_u, timeout=timeout) as r:
-									return r.read().decode('utf-8', errors='ignore')
+									return r.read()
 							except Exception as e3:
 								last_err = e3
 					# if all failed, raise the last error
@@ -2377,34 +2792,42 @@ class MainWindow(QMainWindow):
 					if not html:
 						continue
 					# extract immediate version tokens from archive page
-					for v in re.findall(r'\b(\d+\.\d+(?:\.\d+)?)\b', html):
-						collected.add(v)
+					for m in _VER_RE_B.finditer(html):
+						collected.add(m.group(1).decode('ascii'))
 					# find monthly links like /spine-changelog/2021/01 or full links
-					for m in re.findall(r'href=["\']([^"\']*spine-changelog/\d{4}/\d{2}[^"\']*)', html, flags=re.IGNORECASE):
-						u = urllib.parse.urljoin(base, m)
+					for m in _MONTHLY_RE_B.finditer(html):
+						u = urllib.parse.urljoin(base, m.group(1).decode('utf-8', errors='ignore'))
 						if u not in monthly_urls:
 							monthly_urls.append(u)
 				except Exception as e:
 					self.info_panel.append(f'Archive host fetch failed: {base} -> {e}')
 
-			# fetch each monthly page and extract explicit versions (look for lines mentioning Spine and version numbers)
-			for mu in monthly_urls:
+			# fetch monthly pages concurrently and extract explicit versions; the
+			# pages are independent so the wall time is ~one round trip instead
+			# of one per month
+			def fetch_monthly(u):
 				try:
-					h = fetch_url(mu)
-					if not h:
-						continue
-					# capture version-like tokens, prefer three-part versions when present
-					for v in re.findall(r"\b(\d+\.\d+(?:\.\d+)?)\b", h):
-						collected.add(v)
+					return fetch_url(u)
 				except Exception as e:
-					self.info_panel.append(f'Monthly page fetch failed: {mu} -> {e}')
+					return e
+			if monthly_urls:
+				with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(monthly_urls))) as ex:
+					for mu, h in zip(monthly_urls, ex.map(fetch_monthly, monthly_urls)):
+						if isinstance(h, Exception):
+							self.info_panel.append(f'Monthly page fetch failed: {mu} -> {h}')
+							continue
+						if not h:
+							continue
+						# capture version-like tokens, prefer three-part versions when present
+						for m in _VER_RE_B.finditer(h):
+							collected.add(m.group(1).decode('ascii'))
 
 			# also try a broader crawl of the /spine-changelog root to find additional pages
 			try:
 				root = 'https://hr.esotericsoftware.com/spine-changelog/'
 				r = fetch_url(root)
-				for v in re.findall(r"\b(\d+\.\d+(?:\.\d+)?)\b", r):
-					collected.add(v)
+				for m in _VER_RE_B.finditer(r):
+					collected.add(m.group(1).decode('ascii'))
 			except Exception:
 				pass
 
@@ -2415,7 +2838,7 @@ class MainWindow(QMainWindow):
 					parts.append(0)
 				return tuple(parts)
 
-			all_vers = sorted({v for v in collected if re.match(r'^\d+\.\d+(?:\.\d+)?$', v)}, key=ver_key, reverse=True)
+			all_vers = sorted({v for v in collected if _VER_RE_STRICT.fullmatch(v)}, key=ver_key, reverse=True)
 			if not all_vers:
 				self.info_panel.append('No versions discovered from web sources')
 			else:
@@ -2454,38 +2877,61 @@ class MainWindow(QMainWindow):
 						self.json_version_combo.addItem(v)
 						added += 1
 				self.info_panel.append(f'Fetched {len(all_vers)} raw versions; condensed to {len(condensed)} entries ({added} new)')
+				# remember the condensed list so the next click skips the crawl
+				try:
+					self.config['spine_version_cache_web'] = {'ts': time.time(), 'versions': condensed}
+					self._save_timer.start()
+				except Exception:
+					pass
 		except Exception as e:
 			self.info_panel.append(f'Could not fetch versions: {e}')
 
 	def refresh_file_list(self):
 		folder = self.folder_display.text()
 		self.list_widget.clear()
-		if not folder or not os.path.isdir(folder):
+		if not folder:
 			return
 		try:
-			files = sorted(os.listdir(folder), key=lambda s: s.lower())
+			# scandir filters on cached DirEntry type info, so non-.spine
+			# entries never cost a stat; missing/invalid folders just fall
+			# through to the empty list.
+			try:
+				with os.scandir(folder) as it:
+					files = sorted(
+						(e.name for e in it
+						 if e.name.lower().endswith(".spine") and e.is_file(follow_symlinks=False)),
+						key=str.lower)
+			except (FileNotFoundError, NotADirectoryError):
+				return
 			# from PySide6.QtWidgets import QListWidgetItem # Already imported globally
 
-			for name in files:
-				if name.lower().endswith(".spine"):
+			# Suspend repaints/signals while filling: each addItem otherwise
+			# triggers a layout pass, which stalls on folders with many files.
+			self.list_widget.setUpdatesEnabled(False)
+			self.list_widget.blockSignals(True)
+			try:
+				for name in files:
 					item = QListWidgetItem() # Don't pass text here, widget handles it
-					# item.setFlags(item.flags() | Qt.ItemIsUserCheckable) 
+					# item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
 					# We rely on the widget for checking, but we keep the item Checked/Unchecked state for compatibility if we sync it.
-					# But standard checkable flag might render a checkbox BEHIND our widget. 
+					# But standard checkable flag might render a checkbox BEHIND our widget.
 					# So let's NOT set ItemIsUserCheckable if we provide our own checkbox.
 					# Or if we want process_selected to work unmodified using item.checkState(), we need to keep the state on the item.
-					
+
 					widget = SpineFileWidget(name, self.available_spine_versions)
-					
+
 					# Set initial item size hint
 					item.setSizeHint(widget.sizeHint())
-					
+
 					self.list_widget.addItem(item)
 					self.list_widget.setItemWidget(item, widget)
-					
+
 					# Initialize widget state
 					widget.setChecked(False)
-					
+			finally:
+				self.list_widget.blockSignals(False)
+				self.list_widget.setUpdatesEnabled(True)
+
 		except Exception as e:
 			QMessageBox.warning(self, "Read Error", f"Could not read folder: {e}")
 
@@ -2527,7 +2973,7 @@ class MainWindow(QMainWindow):
 			if found_json and os.path.exists(found_json):
 				try:
 					with open(found_json, 'r', encoding='utf-8', errors='ignore') as fh:
-						obj = json.load(fh)
+						obj = _jload(fh)
 					
 					# Fallback Version Detection: If source version is Unknown, grab it from the exported JSON
 					if 'skeleton' in obj and 'spine' in obj['skeleton']:
@@ -2573,81 +3019,54 @@ class MainWindow(QMainWindow):
 											self.log_warning(msg)
 					
 
-					# Define collection helpers properly for Spine JSON structure
-					def collect_spine_images(json_obj):
-						paths = set()
-						skins = json_obj.get('skins', [])
-						
-						# Standardize skins into a single format of slot -> attachment dicts
-						temp_skin_dicts = []
-						if isinstance(skins, dict):
-							for _, sdict in skins.items():
-								if isinstance(sdict, dict):
-									temp_skin_dicts.append(sdict)
-						elif isinstance(skins, list):
-							for item in skins:
-								if isinstance(item, dict):
-									if 'attachments' in item and isinstance(item.get('attachments'), dict):
-										temp_skin_dicts.append(item.get('attachments'))
+					# Standardize skins into a single format of slot -> attachment dicts
+					temp_skin_dicts = []
+					skins = obj.get('skins', [])
+					if isinstance(skins, dict):
+						for _, sdict in skins.items():
+							if isinstance(sdict, dict):
+								temp_skin_dicts.append(sdict)
+					elif isinstance(skins, list):
+						for item in skins:
+							if isinstance(item, dict):
+								if 'attachments' in item and isinstance(item.get('attachments'), dict):
+									temp_skin_dicts.append(item.get('attachments'))
+								else:
+									for k, v in item.items():
+										if k not in ('name', 'attachments') and isinstance(v, dict):
+											temp_skin_dicts.append(v)
+
+					# One descent over the flattened skins collects both the image
+					# references and the defined (slot, attachment) instances; the
+					# skins used to be re-standardized and walked once per consumer.
+					fresh_paths = set()
+					defined_instances = set()
+					for skin_dict in temp_skin_dicts:
+						for slot_name, slot_data in skin_dict.items():
+							if isinstance(slot_data, dict):
+								for att_name, att_val in slot_data.items():
+									defined_instances.add((slot_name, att_name))
+									ref = None
+									if isinstance(att_val, dict):
+										# Filter out non-image attachment types
+										att_type = att_val.get('type', 'region')
+										if att_type in ['boundingbox', 'path', 'point', 'clipping']:
+											continue
+										# Extract from explicit properties, defaulting to attachment name
+										ref = att_val.get('path') or att_val.get('name') or att_name
+									elif isinstance(att_val, str):
+										ref = att_val
 									else:
-										for k, v in item.items():
-											if k not in ('name', 'attachments') and isinstance(v, dict):
-												temp_skin_dicts.append(v)
-												
-						for skin_dict in temp_skin_dicts:
-							for slot_name, slot_data in skin_dict.items():
-								if isinstance(slot_data, dict):
-									for att_name, att_val in slot_data.items():
-										ref = None
-										if isinstance(att_val, dict):
-											# Filter out non-image attachment types
-											att_type = att_val.get('type', 'region')
-											if att_type in ['boundingbox', 'path', 'point', 'clipping']:
-												continue
-											# Extract from explicit properties, defaulting to attachment name
-											ref = att_val.get('path') or att_val.get('name') or att_name
-										elif isinstance(att_val, str):
-											ref = att_val
-										else:
-											ref = att_name
-											
-										if ref:
-											paths.add(str(ref))
-						return paths
+										ref = att_name
+
+									if ref:
+										fresh_paths.add(str(ref))
 
-					# Run collection immediately
-					fresh_paths = collect_spine_images(obj)
 					image_paths.update(fresh_paths)
 					json_image_paths.update(fresh_paths)
-					
+
 					# ================= NEW LOGIC: FIND UNUSED ATTACHMENTS =================
 					try:
-						# Gather all defined attachments by (slot, attachment)
-						defined_instances = set()
-						skins = obj.get('skins', [])
-						
-						# Standardize skins into a single format of slot -> attachment dicts
-						temp_skin_dicts = []
-						if isinstance(skins, dict):
-							for _, sdict in skins.items():
-								if isinstance(sdict, dict):
-									temp_skin_dicts.append(sdict)
-						elif isinstance(skins, list):
-							for item in skins:
-								if isinstance(item, dict):
-									if 'attachments' in item and isinstance(item.get('attachments'), dict):
-										temp_skin_dicts.append(item.get('attachments'))
-									else:
-										for k, v in item.items():
-											if k not in ('name', 'attachments') and isinstance(v, dict):
-												temp_skin_dicts.append(v)
-
-						for skin_dict in temp_skin_dicts:
-							for slot_name, slot_data in skin_dict.items():
-								if isinstance(slot_data, dict):
-									for att_name in slot_data.keys():
-										defined_instances.add((slot_name, att_name))
-						
 						# Gather setup pose attachments
 						setup_instances = set()
 						for slot in obj.get('slots', []):
@@ -2848,7 +3267,31 @@ class MainWindow(QMainWindow):
 									for d in search_dirs:
 										if d and os.path.isfile(os.path.join(d, path_str)): return True
 									return False
-								
+
+								# Fuzzy-match index, built lazily on the first miss: one walk
+								# over search_dirs instead of a full recursive walk per
+								# unresolved reference.
+								fuzzy_keys = None
+								def build_fuzzy_keys():
+									keys = set()
+									for d in search_dirs:
+										if not d or not os.path.exists(d): continue
+										stack = [d]
+										while stack:
+											cur = stack.pop()
+											try:
+												with os.scandir(cur) as it:
+													for e in it:
+														if e.is_dir(follow_symlinks=False):
+															stack.append(e.path)
+														else:
+															fl = e.name.lower()
+															keys.add(fl)
+															keys.add(os.path.splitext(fl)[0])
+											except OSError:
+												continue
+									return sorted(keys)
+
 								for p in json_image_paths:
 									# Do not report as missing if it is explicitly unchecked for export
 									p_region = os.path.splitext(p)[0].replace('\\', '/')
@@ -2860,19 +3303,15 @@ class MainWindow(QMainWindow):
 
 									if not find_file(p):
 										# Try without extension or matching basename
-										found_fuzzy = False
-										base = os.path.basename(p)
-										for d in search_dirs:
-											if not d or not os.path.exists(d): continue
-											for root, dirs, files in os.walk(d):
-												for f in files:
-													# simple prefix match
-													if f.lower().startswith(base.lower()) or os.path.splitext(f)[0].lower() == base.lower():
-														found_fuzzy = True
-														break
-												if found_fuzzy: break
-											if found_fuzzy: break
-										
+										# (prefix match against the sorted index; noext
+										# keys are prefixes of their full names so the
+										# bisect probe covers both original checks)
+										if fuzzy_keys is None:
+											fuzzy_keys = build_fuzzy_keys()
+										base_l = os.path.basename(p).lower()
+										i = bisect.bisect_left(fuzzy_keys, base_l)
+										found_fuzzy = i < len(fuzzy_keys) and fuzzy_keys[i].startswith(base_l)
+
 										if not found_fuzzy:
 											missing_files.append(p)
 								
@@ -2898,7 +3337,7 @@ class MainWindow(QMainWindow):
 					# fallback to raw text regex if JSON parsing fails
 					with open(found_json, 'r', encoding='utf-8', errors='ignore') as fh:
 						data = fh.read()
-						for m in re.findall(r'([\w\-/\\]+\.(?:png|jpg|jpeg|webp|bmp|tga))', data, flags=re.IGNORECASE):
+						for m in _IMG_REF_RE.findall(data):
 							image_paths.add(m)
 							json_image_paths.add(m)
 
@@ -2913,7 +3352,7 @@ class MainWindow(QMainWindow):
 							if not line:
 								continue
 							# atlas files commonly list image names (one per section)
-							if re.search(r'\.(?:png|jpg|jpeg|webp|bmp|tga)$', line, flags=re.IGNORECASE):
+							if line.lower().endswith(_IMG_EXTS):
 								# Check if next line starts with 'size:', indicating this is a page header, not a region
 								if idx + 1 < len(lines) and lines[idx+1].strip().lower().startswith('size:'):
 									continue
@@ -2930,7 +3369,7 @@ class MainWindow(QMainWindow):
 							line = line.strip()
 							if not line:
 								continue
-							if re.search(r'\.(?:png|jpg|jpeg|webp|bmp|tga)$', line, flags=re.IGNORECASE):
+							if line.lower().endswith(_IMG_EXTS):
 								# Apply same logic for .txt if it happens to be an atlas
 								if idx + 1 < len(lines) and lines[idx+1].strip().lower().startswith('size:'):
 									continue
@@ -2938,12 +3377,19 @@ class MainWindow(QMainWindow):
 								info_image_paths.add(line)
 
 			# also include any image files physically present in the export folder (recursive)
-			for root, dirs, files in os.walk(result_dir):
-				for fn in files:
-					if re.search(r'\.(?:png|jpg|jpeg|webp|bmp|tga)$', fn, flags=re.IGNORECASE):
-						# store relative path to result_dir so later resolution can join correctly
-						rel = os.path.relpath(os.path.join(root, fn), result_dir)
-						image_paths.add(rel)
+			stack = [result_dir]
+			while stack:
+				cur = stack.pop()
+				try:
+					with os.scandir(cur) as it:
+						for e in it:
+							if e.is_dir(follow_symlinks=False):
+								stack.append(e.path)
+							elif e.name.lower().endswith(_IMG_EXTS):
+								# store relative path to result_dir so later resolution can join correctly
+								image_paths.add(os.path.relpath(e.path, result_dir))
+				except OSError:
+					continue
 		except Exception as e:
 			msg = f"{name}: error parsing exports: {e}"
 			errors.append(msg)
@@ -3004,10 +3450,15 @@ class MainWindow(QMainWindow):
 
 
 
-		# Debug: show collected image references from exports
+		# Debug: show collected image references from exports. The sorted
+		# join over thousands of paths (and the QTextEdit re-layout it
+		# forces) is only worth paying when debug logging is on.
 		try:
 			if image_paths:
-				self.info_panel.append("Collected image refs: " + ", ".join(sorted(image_paths)))
+				if self.debug:
+					self.info_panel.append("Collected image refs (%d): %s" % (len(image_paths), ", ".join(sorted(image_paths))))
+				else:
+					self.info_panel.append("Collected image refs: %d" % len(image_paths))
 		except Exception:
 			pass
 		
@@ -3022,22 +3473,34 @@ class MainWindow(QMainWindow):
 		
 		# Pre-scan for exact filename matches to avoid aggressive collection
 		# Map basename_lower -> list of full absolute paths
-		file_map = {} 
+		file_map = {}
 		for d in search_dirs:
 			if not d or not os.path.exists(d): continue
-			for root, dirs, files in os.walk(d):
-				for f in files:
-					if f.lower().endswith(('.png', '.jpg', '.jpeg')):
-						# key by basename without extension
-						bn_noext = os.path.splitext(f)[0].lower()
-						fp = os.path.normcase(os.path.abspath(os.path.join(root, f)))
-						if bn_noext not in file_map: file_map[bn_noext] = []
-						file_map[bn_noext].append(fp)
-						
-						# also key by full basename
-						bn_full = f.lower()
-						if bn_full not in file_map: file_map[bn_full] = []
-						file_map[bn_full].append(fp)
+			# Iterative scandir walk: DirEntry caches the file type, so this
+			# avoids the per-entry stat calls os.walk pays for.
+			stack = [d]
+			while stack:
+				cur = stack.pop()
+				try:
+					with os.scandir(cur) as it:
+						for entry in it:
+							if entry.is_dir(follow_symlinks=False):
+								stack.append(entry.path)
+								continue
+							f = entry.name
+							if f.lower().endswith(('.png', '.jpg', '.jpeg')):
+								# key by basename without extension
+								bn_noext = os.path.splitext(f)[0].lower()
+								fp = os.path.normcase(os.path.abspath(entry.path))
+								if bn_noext not in file_map: file_map[bn_noext] = []
+								file_map[bn_noext].append(fp)
+
+								# also key by full basename
+								bn_full = f.lower()
+								if bn_full not in file_map: file_map[bn_full] = []
+								file_map[bn_full].append(fp)
+				except OSError:
+					continue
 
 		for ip in image_paths:
 			# Cleaning the path from spine
@@ -3102,7 +3565,10 @@ class MainWindow(QMainWindow):
 		resolved = list(resolved)
 		try:
 			if resolved:
-				self.info_panel.append("Resolved image files: " + ", ".join(resolved))
+				if self.debug:
+					self.info_panel.append("Resolved image files (%d): %s" % (len(resolved), ", ".join(resolved)))
+				else:
+					self.info_panel.append("Resolved image files: %d" % len(resolved))
 		except Exception:
 			pass
 
@@ -4154,104 +4620,199 @@ class MainWindow(QMainWindow):
 				df.write(f"Configured Threshold: {self.config.get('opacity_threshold', self.opacity_slider.value())}%\n")
 				df.write(f"Configured Alpha Cutoff: {self.config.get('alpha_cutoff', 250)}\n")
 
-			total_resolved = len(resolved)
-			
-			for idx, img_path in enumerate(resolved):
-				# Skip .spine files or other non-image files that might have been picked up
-				if img_path.lower().endswith('.spine') or img_path.lower().endswith('.json'):
-					continue
-
-				# Progress update: Opacity check (20-50 range)
-				if total_resolved > 0:
-					p = 20 + int((idx / total_resolved) * 30)
-					self.progress_bar.setValue(base_progress + p)
-					QApplication.processEvents()
-					
+			last_progress_pct = -1
+
+			# Analysis phase runs in a worker pool: per-image stat, cache lookup,
+			# decode and pixel counting touch no Qt state, and the PIL decoders
+			# release the GIL, so images overlap across cores. Cache writes,
+			# logging and the final verdicts stay on the GUI thread below.
+			alpha_cutoff = int(self.config.get("alpha_cutoff", 250))
+			eligible = [p for p in resolved
+				if not (p.lower().endswith('.spine') or p.lower().endswith('.json'))]
+
+			def analyze_one(img_path):
+				# Returns (ratio, opaque_count, total, tcorners, sig, fresh, err)
+				# Re-use prior analysis when the file is unchanged: keyed by
+				# path, with the mtime+size signature stored in the entry so an
+				# edited file replaces its slot instead of piling up new keys.
+				sig = None
+				try:
+					st = os.stat(img_path)
+					sig = f"{st.st_mtime}:{st.st_size}"
+				except Exception:
+					pass
+				cached = None
+				if sig is not None:
+					slot = self._opacity_cache.get(img_path)
+					if isinstance(slot, dict) and slot.get('sig') == sig:
+						cached = slot.get('cutoffs', {}).get(str(alpha_cutoff))
+				if cached is not None:
+					return (float(cached.get('ratio', 1.0)), int(cached.get('opaque', 0)),
+						int(cached.get('total', 0)), int(cached.get('tcorners', 0)),
+						sig, False, None)
 				try:
 					im = Image.open(img_path)
-					# convert to RGBA to reliably access alpha channel
-					rgba = im.convert('RGBA')
-					alpha = rgba.split()[-1]
-					data = list(alpha.getdata())
-					total = len(data)
-					if total == 0:
-						# treat empty images as opaque to avoid divide-by-zero
+					# Modes without an alpha channel (JPEG, plain RGB/L PNGs)
+					# are trivially fully opaque: answer from the header alone
+					# instead of decoding and converting the whole image.
+					if 'A' not in im.mode and 'transparency' not in im.info:
+						total = im.size[0] * im.size[1]
+						opaque_count = total
 						ratio = 1.0
-						opaque_count = 0
+						data = []
 					else:
-						# use configured alpha cutoff (count pixels with alpha >= cutoff as opaque)
-						alpha_cutoff = int(self.config.get("alpha_cutoff", 250))
-						opaque_count = sum(1 for v in data if v >= alpha_cutoff)
-						ratio = opaque_count / total
-					# threshold from slider (percentage)
-					threshold_val_config = float(self.config.get("opacity_threshold", self.opacity_slider.value()))
-					threshold = threshold_val_config / 100.0
-					fully_opaque = (ratio >= threshold)
-					
-					# Smart Corner Detection:
-					# If the image is considered opaque by ratio, but has transparent corners, 
-					# it is likely a rounded-rect asset (like a card or button) that MUST be PNG.
-					# Note: This is now optional via config
-					if fully_opaque and total > 0 and self.config.get("smart_corner_detection", True):
-						width, height = im.size
-						# Check 4 corners if image is large enough (at least 8x8 to check blocks)
-						if width >= 8 and height >= 8:
-							# Use a stricter threshold (e.g. 15) for structural transparency checks
-							# independently of the global alpha_cutoff which might be high.
-							# This avoids false positives on backgrounds with faint vignettes.
-							corner_strict_cutoff = 20
-							
-							# Define 4 corner blocks (top-left, top-right, bottom-left, bottom-right)
-							# We check a small 4x4 sample at each corner.
-							# If the *average* alpha of the corner block is low, it's a structural corner.
-							# Single pixel checks are too sensitive to noise/AA.
-							block_size = 4
-							corners_starts = [(0,0), (width-block_size, 0), (0, height-block_size), (width-block_size, height-block_size)]
-							
-							transparent_corners = 0
-							for start_x, start_y in corners_starts:
-								# Analyze the block
-								block_transparent_pixels = 0
-								total_block_pixels = 0
-								
-								for by in range(block_size):
-									for bx in range(block_size):
-										cx = start_x + bx
-										cy = start_y + by
-										c_idx = cy * width + cx
-										if 0 <= c_idx < len(data):
-											total_block_pixels += 1
-											if data[c_idx] <= corner_strict_cutoff:
-												block_transparent_pixels += 1
-								
-								# If > 75% of the corner block is transparent, count it as a transparent corner
-								if total_block_pixels > 0 and (block_transparent_pixels / total_block_pixels) > 0.75:
-									transparent_corners += 1
-							
-							# If 3 or more corners are strictly transparent, force PNG
-							if transparent_corners >= 3:
-								fully_opaque = False
-								try:
-									self.info_panel.append(f"  > Detected {transparent_corners} transparent corners in {os.path.basename(img_path)}. Forcing PNG.")
-								except: pass
-
-					# LOG DETAIL
-					with open(debug_log_path, "a") as df:
-						status = "OPAQUE" if fully_opaque else "TRANSPARENT"
-						df.write(f"FILE: {os.path.basename(img_path)} | OpaquePix: {opaque_count}/{total} | Ratio: {ratio*100:.2f}% | Threshold: {threshold*100}% | Result: {status}\n")
-
-					# log percentage for visibility
-					try:
-						self.info_panel.append(f"Opacity for {img_path}: {ratio*100:.2f}% ({opaque_count}/{total})")
-					except Exception:
-						pass
-					opaque_results.append((img_path, fully_opaque))
+						# convert to RGBA to reliably access alpha channel
+						rgba = im.convert('RGBA')
+						alpha = rgba.split()[-1]
+						# getextrema scans the band in C: if even the minimum
+						# alpha clears the cutoff the image is fully opaque and
+						# the per-pixel count can be skipped. The > 20 guard
+						# keeps the corner check's stricter threshold valid
+						# (corners count pixels <= 20 as transparent).
+						amin = alpha.getextrema()[0]
+						if amin >= alpha_cutoff and amin > 20:
+							total = im.size[0] * im.size[1]
+							opaque_count = total
+							ratio = 1.0
+							data = []
+						elif OPENCV_AVAILABLE:
+							# Zero-copy view of the alpha band; the compare
+							# and sum run as single C loops instead of a
+							# Python generator over per-pixel ints.
+							data = np.asarray(alpha, dtype=np.uint8).ravel()
+							total = int(data.size)
+							if total == 0:
+								# treat empty images as opaque to avoid divide-by-zero
+								ratio = 1.0
+								opaque_count = 0
+							else:
+								opaque_count = int((data >= alpha_cutoff).sum())
+								ratio = opaque_count / total
+						else:
+							data = list(alpha.getdata())
+							total = len(data)
+							if total == 0:
+								# treat empty images as opaque to avoid divide-by-zero
+								ratio = 1.0
+								opaque_count = 0
+							else:
+								# use configured alpha cutoff (count pixels with alpha >= cutoff as opaque)
+								opaque_count = sum(1 for v in data if v >= alpha_cutoff)
+								ratio = opaque_count / total
+
+					# Corner sampling for Smart Corner Detection (see below).
+					# Computed while the pixels are in hand so cache hits can
+					# skip the decode; only 4 small blocks are touched.
+					transparent_corners = 0
+					width, height = im.size
+					# Check 4 corners if image is large enough (at least 8x8 to check
+					# blocks); nothing to sample when the header shortcut skipped
+					# decode (len() so the check also works on ndarray data)
+					if len(data) and width >= 8 and height >= 8:
+						# Use a stricter threshold (e.g. 15) for structural transparency checks
+						# independently of the global alpha_cutoff which might be high.
+						# This avoids false positives on backgrounds with faint vignettes.
+						corner_strict_cutoff = 20
+
+						# Define 4 corner blocks (top-left, top-right, bottom-left, bottom-right)
+						# We check a small 4x4 sample at each corner.
+						# If the *average* alpha of the corner block is low, it's a structural corner.
+						# Single pixel checks are too sensitive to noise/AA.
+						block_size = 4
+						corners_starts = [(0,0), (width-block_size, 0), (0, height-block_size), (width-block_size, height-block_size)]
+
+						for start_x, start_y in corners_starts:
+							# Analyze the block
+							block_transparent_pixels = 0
+							total_block_pixels = 0
+
+							for by in range(block_size):
+								for bx in range(block_size):
+									cx = start_x + bx
+									cy = start_y + by
+									c_idx = cy * width + cx
+									if 0 <= c_idx < len(data):
+										total_block_pixels += 1
+										if data[c_idx] <= corner_strict_cutoff:
+											block_transparent_pixels += 1
+
+							# If > 75% of the corner block is transparent, count it as a transparent corner
+							if total_block_pixels > 0 and (block_transparent_pixels / total_block_pixels) > 0.75:
+								transparent_corners += 1
+
+					return (ratio, opaque_count, total, transparent_corners, sig, True, None)
 				except Exception as e:
-					msg = f"{name}: image analyze warning {img_path}: {e}"
+					return (0.0, 0, 0, 0, sig, False, e)
+
+			analysis = []
+			if eligible:
+				with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as ex:
+					futs = [ex.submit(analyze_one, ep) for ep in eligible]
+					# Progress update: Opacity check (20-50 range). Driven by
+					# completions; only touch the bar when the percentage moves.
+					done_count = 0
+					for _ in concurrent.futures.as_completed(futs):
+						done_count += 1
+						p = 20 + int((done_count / len(eligible)) * 30)
+						if p != last_progress_pct:
+							last_progress_pct = p
+							self.progress_bar.setValue(base_progress + p)
+							QApplication.processEvents()
+					analysis = [f.result() for f in futs]
+
+			# threshold from slider (percentage)
+			threshold = float(self.config.get("opacity_threshold", self.opacity_slider.value())) / 100.0
+			smart_corners_enabled = self.config.get("smart_corner_detection", True)
+			cache_dirty = False
+
+			for img_path, (ratio, opaque_count, total, transparent_corners, sig, fresh, err) in zip(eligible, analysis):
+				if err is not None:
+					msg = f"{name}: image analyze warning {img_path}: {err}"
 					# unexpected warnings shouldn't stop the show or scare the user
 					self.log_warning(msg)
 					# Should default to False (Transparent) on error to be safe
 					opaque_results.append((img_path, False))
+					continue
+
+				if fresh and sig:
+					slot = self._opacity_cache.get(img_path)
+					if not (isinstance(slot, dict) and slot.get('sig') == sig):
+						# New file or edited file: replace the whole slot so
+						# superseded signatures never accumulate.
+						slot = {'sig': sig, 'cutoffs': {}}
+						self._opacity_cache[img_path] = slot
+					slot['cutoffs'][str(alpha_cutoff)] = {
+						'ratio': ratio, 'opaque': opaque_count, 'total': total, 'tcorners': transparent_corners}
+					cache_dirty = True
+
+				fully_opaque = (ratio >= threshold)
+
+				# Smart Corner Detection:
+				# If the image is considered opaque by ratio, but has transparent corners,
+				# it is likely a rounded-rect asset (like a card or button) that MUST be PNG.
+				# Note: This is now optional via config
+				if fully_opaque and total > 0 and smart_corners_enabled:
+					# If 3 or more corners are strictly transparent, force PNG
+					if transparent_corners >= 3:
+						fully_opaque = False
+						try:
+							self.info_panel.append(f"  > Detected {transparent_corners} transparent corners in {os.path.basename(img_path)}. Forcing PNG.")
+						except: pass
+
+				# LOG DETAIL
+				with open(debug_log_path, "a") as df:
+					status = "OPAQUE" if fully_opaque else "TRANSPARENT"
+					df.write(f"FILE: {os.path.basename(img_path)} | OpaquePix: {opaque_count}/{total} | Ratio: {ratio*100:.2f}% | Threshold: {threshold*100}% | Result: {status}\n")
+
+				# log percentage for visibility
+				try:
+					self.info_panel.append(f"Opacity for {img_path}: {ratio*100:.2f}% ({opaque_count}/{total})")
+				except Exception:
+					pass
+				opaque_results.append((img_path, fully_opaque))
+
+			if cache_dirty:
+				self._save_timer.start()
 		else:
 			self.info_panel.append("Skipping opacity analysis (Sort all opaque to jpeg is OFF)")
 
@@ -4275,23 +4836,49 @@ class MainWindow(QMainWindow):
 
 		# --- Sorting algorithm: copy attachments into jpeg/png and rebuild JSON ---
 		if hasattr(self, 'status_label'): self.status_label.setText(f"Sorting images: {ui_label_text}")
+		copy_pool = None
+		copy_futures = []
 		try:
 			if found_json and os.path.exists(found_json):
-				# build opaque map (basename or full path -> opaque)
+				# Copies are submitted to a small thread pool so disk I/O
+				# overlaps the per-attachment bookkeeping; joined (and any
+				# failures logged) before the JSON is written.
+				copy_pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4))
+				copy_futures = []
+				# build opaque map: one canonical key per file (absolute path,
+				# lowercased; abspath already normpaths) so inserts and lookups
+				# cost a single hash each
 				opaque_map = {}
 				for p, ok in opaque_results:
-					is_ok = bool(ok)
-					opaque_map[p] = is_ok
-					opaque_map[os.path.normpath(p)] = is_ok
-					opaque_map[os.path.abspath(p)] = is_ok
-					opaque_map[p.lower()] = is_ok # handle potential case mismatch
+					opaque_map[os.path.abspath(p).lower()] = bool(ok)
 					# REMOVED: Basename fallback to prevent collisions (e.g. skin1/head.png vs skin2/head.png)
 					# opaque_map[os.path.basename(p)] = is_ok
 					# opaque_map[os.path.basename(p).lower()] = is_ok
 
-				# load json
-				with open(found_json, 'r', encoding='utf-8', errors='ignore') as fh:
-					j = json.load(fh)
+				# canonical-key memo: the same frame paths are looked up once
+				# per attachment occurrence, and abspath is not cheap
+				_canon_cache = {}
+
+				def opaque_lookup(path):
+					"""Return (found, is_opaque) using the canonical key."""
+					k = _canon_cache.get(path)
+					if k is None:
+						k = _canon_cache[path] = os.path.abspath(path).lower()
+					if k in opaque_map:
+						return True, opaque_map[k]
+					return False, False
+
+				# load json (orjson parses large skeletons several times faster)
+				with open(found_json, 'rb') as fh:
+					raw_json = fh.read()
+				if orjson is not None:
+					try:
+						j = orjson.loads(raw_json)
+					except Exception:
+						j = json.loads(raw_json.decode('utf-8', errors='ignore'))
+				else:
+					j = json.loads(raw_json.decode('utf-8', errors='ignore'))
+				del raw_json
 
 				# Extract all skin names for exclusion logic
 				all_skin_names = set()
@@ -4311,12 +4898,23 @@ class MainWindow(QMainWindow):
 										if isinstance(v, dict):
 											all_skin_names.add(k)
 
-				# skeleton name
+				# intern the skin names: the same handful of short strings is
+				# hashed and compared millions of times in the ownership and
+				# exclusion filters, and interned keys compare by pointer
+				all_skin_names = {sys.intern(s) for s in all_skin_names if isinstance(s, str)}
+
+				# skeleton name (lowered variants hoisted: the ownership and
+				# other-skeleton checks compare against them per path part)
 				internal_skeleton_name = os.path.splitext(os.path.basename(found_json))[0]
 				skeleton_name = os.path.splitext(os.path.basename(input_path))[0]
-
-				# build slot blend map
-				slot_blend = {}
+				skeleton_name_l = skeleton_name.lower()
+				skeleton_name_l_sing = skeleton_name_l.rstrip('s')
+				internal_skeleton_name_l = internal_skeleton_name.lower()
+				internal_skeleton_name_l_sing = internal_skeleton_name_l.rstrip('s')
+
+				# build slot blend map (defaultdict so lookups skip the
+				# per-call default argument)
+				slot_blend = defaultdict(lambda: 'normal')
 				for s in j.get('slots', []):
 					slot_blend[s.get('name')] = s.get('blend', 'normal')
 
@@ -4350,16 +4948,23 @@ class MainWindow(QMainWindow):
 						dirs = parts[:-1]
 						for d in dirs:
 							# Exclude skeleton name and pluralization to prevent root folder hijacking
-							if (d == skeleton_name.lower() or d.rstrip('s') == skeleton_name.lower().rstrip('s') or
-								d == internal_skeleton_name.lower() or d.rstrip('s') == internal_skeleton_name.lower().rstrip('s')):
+							if (d == skeleton_name_l or d.rstrip('s') == skeleton_name_l_sing or
+								d == internal_skeleton_name_l or d.rstrip('s') == internal_skeleton_name_l_sing):
 								continue
 
 							if d not in ['jpeg', 'png', 'images', 'skeleton', 'root', 'common', 'assets', 'source', 'reference']:
+								d = sys.intern(d)
 								if d not in folder_owners: folder_owners[d] = set()
 								folder_owners[d].add(skin_name)
 
-				# Walk skins to populate folder_owners
-				temp_skins_analysis = j.get('skins', {})
+				# Walk skins to populate folder_owners. The skin-folder
+				# preservation block consults ownership for any named,
+				# non-default skin — even a lone one — so the walk may only be
+				# skipped when no skin can reach it (no skins at all, or the
+				# single skin is 'default').
+				_owners_unused = (not all_skin_names) or (
+					len(all_skin_names) == 1 and next(iter(all_skin_names)).lower() == 'default')
+				temp_skins_analysis = {} if _owners_unused else j.get('skins', {})
 				if isinstance(temp_skins_analysis, dict):
 					for s_name, s_node in temp_skins_analysis.items():
 						if isinstance(s_node, dict):
@@ -4405,15 +5010,91 @@ class MainWindow(QMainWindow):
 				# Debug folder owners
 				try:
 					self.info_panel.append(f"Folder ownership analysis: {len(folder_owners)} folders tracked.")
-					for f, owners in folder_owners.items():
-						self.info_panel.append(f"  Folder '{f}' owned by: {', '.join(owners)}")
+					if self.debug:
+						for f, owners in folder_owners.items():
+							self.info_panel.append(f"  Folder '{f}' owned by: {', '.join(owners)}")
 				except: pass
 
-				# helper: find source file for an image reference
+				# sequence regexes depend only on the reference's core base name,
+				# which repeats heavily across skins — cache the compiled patterns
+				seq_re_cache = {}
+
+				# alternation pattern over the other-skin names, one per skin:
+				# lets the exclusion filter scan each path part in a single
+				# C-level search instead of a Python loop over every skin name
+				other_skin_re_cache = {}
+
+				# memoize the known-skeleton match per first-folder name: the
+				# exact/pluralization/version-prefix chain otherwise re-runs
+				# over all_skeleton_names for every attachment
+				_skel_match_cache = {}
+
+				def _match_known_skeleton(potential_lower):
+					if potential_lower in _skel_match_cache:
+						return _skel_match_cache[potential_lower]
+					match = None
+					for s in (all_skeleton_names or ()):
+						s_lower = s.lower()
+						if s_lower == potential_lower:
+							match = s; break
+						if s_lower.rstrip('s') == potential_lower.rstrip('s'):
+							match = s; break
+						# Version prefix check: skeleton "symbols_v6" matches folder "symbols"
+						if s_lower.startswith(potential_lower):
+							rest = s_lower[len(potential_lower):]
+							if rest and (rest[0] in ['_', '-', 'v', '.'] or rest[0].isdigit()):
+								match = s; break
+					_skel_match_cache[potential_lower] = match
+					return match
+
+				# One-time index over the resolved candidates: exact-name hits
+				# become dict lookups and the sequence/prefix scan walks only the
+				# contiguous sorted slice sharing the reference's core prefix,
+				# instead of the whole candidate list per reference.
+				_by_noext = {}
+				_by_basename = {}
+				_sorted_noext = []
+				for _cand in resolved:
+					_bn = os.path.basename(_cand).lower()
+					_name_noext = os.path.splitext(_bn)[0]
+					_by_noext.setdefault(_name_noext, []).append(_cand)
+					_by_basename.setdefault(_bn, []).append(_cand)
+					_sorted_noext.append((_name_noext, _cand))
+				_sorted_noext.sort()
+
+				# memoize lookups per JSON: the same reference recurs across
+				# skins/slots, and the candidate set is fixed for this pass
+				_find_cache = {}
+
+				# pre-split directory components once per candidate; the skin
+				# filters otherwise redo lower/replace/split for every
+				# (candidate, skin) pair
+				_cand_parts_cache = {}
+
+				def _dir_parts(c):
+					cached = _cand_parts_cache.get(c)
+					if cached is None:
+						# interned parts hit the pointer-equality fast path when
+						# probed against folder_owners and the skin-name sets
+						parts = [sys.intern(p) for p in os.path.dirname(c).lower().replace('\\', '/').split('/')]
+						cached = (parts, frozenset(parts))
+						_cand_parts_cache[c] = cached
+					return cached
+
 				def find_source_image(ref_name, skin_context=None):
+					key = (os.path.normpath(ref_name).lower(), skin_context)
+					if key in _find_cache:
+						return _find_cache[key]
+					result = _find_source_image_uncached(ref_name, skin_context)
+					_find_cache[key] = result
+					return result
+
+				# helper: find source file for an image reference
+				def _find_source_image_uncached(ref_name, skin_context=None):
 					# Debug: log the reference being searched
 					try:
-						self.info_panel.append(f"find_source_image: looking for ref '{ref_name}'")
+						if self.debug:
+							self.info_panel.append(f"find_source_image: looking for ref '{ref_name}'")
 					except Exception:
 						pass
 					
@@ -4432,19 +5113,15 @@ class MainWindow(QMainWindow):
 						# Strategy 1: Exact folder name match (e.g. .../pink/...)
 						filtered = []
 						for c in candidates:
-							dir_path = os.path.dirname(c).lower().replace('\\', '/')
-							parts = dir_path.split('/')
-							if skin_norm in parts:
+							if skin_norm in _dir_parts(c)[1]:
 								filtered.append(c)
 						if filtered: return filtered
 
 						# Strategy 2: Partial folder name match (e.g. .../skin_pink/...)
 						# We look for the skin name as a substring in the path parts
 						for c in candidates:
-							dir_path = os.path.dirname(c).lower().replace('\\', '/')
-							parts = dir_path.split('/')
 							# Check if skin name is part of any folder name
-							if any(skin_norm in p for p in parts):
+							if any(skin_norm in p for p in _dir_parts(c)[0]):
 								filtered.append(c)
 						if filtered: return filtered
 						
@@ -4456,9 +5133,8 @@ class MainWindow(QMainWindow):
 						if folder_owners:
 							filtered_ownership = []
 							for c in candidates:
-								dir_path = os.path.dirname(c).lower().replace('\\', '/')
-								parts = dir_path.split('/')
-								
+								parts = _dir_parts(c)[0]
+
 								keep = True
 								for p in parts:
 									if p in folder_owners:
@@ -4490,34 +5166,26 @@ class MainWindow(QMainWindow):
 						# Fallback to name-based exclusion if no ownership data
 						# Identify other skins to exclude
 						# We exclude all known skins EXCEPT the current one and "default"
-						IGNORED_SKIN_FOLDERS = {'images', 'common', 'assets', 'source', 'root', 'skeleton', 'jpeg', 'png', 'reference'}
-						other_skins = {s.lower() for s in all_skin_names if s.lower() != skin_norm and s.lower() != 'default' and s.lower() not in IGNORED_SKIN_FOLDERS}
+						other_skins = {sl for sl in (s.lower() for s in all_skin_names) if sl != skin_norm and sl != 'default' and sl not in _IGNORED_SKIN_FOLDERS}
 						
 						if not other_skins:
 							return candidates
 
 
+						# Exact matches are substrings of themselves, so one
+						# alternation search per part covers both the exact and
+						# partial checks the old nested loops did.
+						other_re = other_skin_re_cache.get(skin_norm)
+						if other_re is None:
+							other_re = other_skin_re_cache.setdefault(skin_norm, re.compile('|'.join(map(re.escape, sorted(other_skins)))))
+
 						filtered_exclusion = []
 						for c in candidates:
-							dir_path = os.path.dirname(c).lower().replace('\\', '/')
-							parts = dir_path.split('/')
-							
-							# Check if any part matches an OTHER skin
-							is_other = False
-							for p in parts:
-								# 1. Exact match
-								if p in other_skins:
-									is_other = True
-									break
-								# 2. Partial match (e.g. "piggy_bank_right" contains "right")
-								# We iterate other skins and check if they are present in the folder name
-								for s in other_skins:
-									if s in p:
-										is_other = True
-										break
-								if is_other: break
-							
-							if not is_other:
+							parts, parts_set = _dir_parts(c)
+							# Check if any part matches an OTHER skin: exact hits
+							# resolve in one C-level isdisjoint before paying the
+							# per-part substring scan.
+							if other_skins.isdisjoint(parts_set) and not any(other_re.search(p) for p in parts):
 								filtered_exclusion.append(c)
 						
 						if filtered_exclusion:
@@ -4537,12 +5205,9 @@ class MainWindow(QMainWindow):
 						return [ref_name]
 					# normalized key lookup against opaque_map: return all matching resolved candidates
 					norm = os.path.normpath(ref_name)
-					if norm in opaque_map:
-						matches = []
+					if opaque_lookup(ref_name)[0]:
 						norm_base = os.path.basename(norm).lower()
-						for cand in resolved:
-							if os.path.basename(cand).lower() == norm_base:
-								matches.append(cand)
+						matches = list(_by_basename.get(norm_base, ()))
 						if matches:
 							# Apply skin filter
 							matches = filter_by_skin(matches, skin_context)
@@ -4554,7 +5219,8 @@ class MainWindow(QMainWindow):
 					base_core = base_l.rstrip('_-')
 					# Debug
 					try:
-						self.info_panel.append(f"find_source_image: base='{base}' core='{base_core}'")
+						if self.debug:
+							self.info_panel.append(f"find_source_image: base='{base}' core='{base_core}'")
 					except Exception:
 						pass
 					# prepare containers
@@ -4562,12 +5228,18 @@ class MainWindow(QMainWindow):
 					prefix_matches = []
 					exact_matches = []
 					# regex to capture numeric suffix after the core base
-					seq_re = re.compile(r'^' + re.escape(base_core) + r'(?:[_\-]?)(\d+)$')
-					for cand in resolved:
-						name_noext = os.path.splitext(os.path.basename(cand))[0].lower()
-						# exact match (filename equals reference basename)
-						if name_noext == base_l:
-							exact_matches.append(cand)
+					seq_re = seq_re_cache.get(base_core)
+					if seq_re is None:
+						seq_re = seq_re_cache.setdefault(base_core, re.compile(r'^' + re.escape(base_core) + r'(?:[_\-]?)(\d+)$'))
+					# exact match (filename equals reference basename)
+					exact_matches = list(_by_noext.get(base_l, ()))
+					# every sequence/prefix candidate starts with base_core, so
+					# only the sorted slice sharing that prefix needs scanning
+					start = bisect.bisect_left(_sorted_noext, (base_core,))
+					for i in range(start, len(_sorted_noext)):
+						name_noext, cand = _sorted_noext[i]
+						if not name_noext.startswith(base_core):
+							break
 						# numeric sequence match (e.g., base_core + sep + digits)
 						m = seq_re.match(name_noext)
 						if m:
@@ -4590,8 +5262,8 @@ class MainWindow(QMainWindow):
 						filtered = []
 						for item in candidates:
 							path = item[1] if is_tuple else item
-							# Get directory of candidate
-							cand_dir = os.path.dirname(path).replace('\\', '/').lower()
+							# Get directory of candidate (from the per-candidate memo)
+							cand_dir = '/'.join(_dir_parts(path)[0])
 							
 							# Check if candidate directory ends with reference directory
 							# We check for exact suffix match with separator to avoid partial matches like "big_win" matching "big_win_shine"
@@ -4616,7 +5288,8 @@ class MainWindow(QMainWindow):
 						# return all exact matches (could be multiple in different folders)
 						# Debug: log exact match
 						try:
-							self.info_panel.append(f"Exact match found for '{ref_name}': {exact_matches[0]}")
+							if self.debug:
+								self.info_panel.append(f"Exact match found for '{ref_name}': {exact_matches[0]}")
 						except Exception:
 							pass
 						return exact_matches
@@ -4635,7 +5308,8 @@ class MainWindow(QMainWindow):
 
 						seq_matches.sort(key=lambda x: x[0])
 						try:
-							self.info_panel.append(f"Sequence detected for '{ref_name}': {len(seq_matches)} frames")
+							if self.debug:
+								self.info_panel.append(f"Sequence detected for '{ref_name}': {len(seq_matches)} frames")
 						except Exception:
 							pass
 						# return ordered list of candidates
@@ -4651,7 +5325,7 @@ class MainWindow(QMainWindow):
 						# attempt numeric-suffix ordering: extract trailing digits from basename
 						def _num_key(path):
 							bn = os.path.splitext(os.path.basename(path))[0]
-							m = re.search(r'(\d+)$', bn)
+							m = _TRAILING_DIGITS.search(bn)
 							if m:
 								return (0, int(m.group(1)))
 							# no trailing digits: fallback to alphabetical
@@ -4661,7 +5335,8 @@ class MainWindow(QMainWindow):
 						except Exception:
 							prefix_matches.sort()
 						try:
-							self.info_panel.append(f"Prefix matches for '{ref_name}': {len(prefix_matches)} found, representative: {os.path.basename(prefix_matches[0])}")
+							if self.debug:
+								self.info_panel.append(f"Prefix matches for '{ref_name}': {len(prefix_matches)} found, representative: {os.path.basename(prefix_matches[0])}")
 						except Exception:
 							pass
 						return prefix_matches
@@ -4810,16 +5485,28 @@ class MainWindow(QMainWindow):
 									if isinstance(v, dict):
 										ALL_SKIN_DICTS.append(v)
 				
-				# Pre-calculate attachment -> slots mapping to avoid massive loop
+				# Pre-calculate attachment -> slots mapping to avoid massive loop.
+				# Slot names are deduped: the same attachment in the same slot
+				# across many skins would otherwise repeat in the list and
+				# inflate every later blend check over it.
 				ATTACHMENT_SLOT_MAP = {}
 				for s_dict in ALL_SKIN_DICTS:
 					if isinstance(s_dict, dict):
 						for s_name, s_val in s_dict.items():
 							if isinstance(s_val, dict):
 								for att_key in s_val:
-									if att_key not in ATTACHMENT_SLOT_MAP:
-										ATTACHMENT_SLOT_MAP[att_key] = []
-									ATTACHMENT_SLOT_MAP[att_key].append(s_name)
+									slots_for_att = ATTACHMENT_SLOT_MAP.get(att_key)
+									if slots_for_att is None:
+										ATTACHMENT_SLOT_MAP[att_key] = [s_name]
+									elif s_name not in slots_for_att:
+										slots_for_att.append(s_name)
+
+				# Precompute the blend verdict per attachment: the attachment
+				# loop then reads one bool instead of re-running all() over the
+				# slot list for every occurrence.
+				ATTACH_NON_NORMAL_ONLY = {}
+				for att_key, att_slots in ATTACHMENT_SLOT_MAP.items():
+					ATTACH_NON_NORMAL_ONLY[att_key] = all(slot_blend[s] != 'normal' for s in att_slots)
 
 				# Global Scan Data (for pre-scan pass)
 				SCAN_SLOT_USAGE = {} # path -> set(slots)
@@ -4828,6 +5515,7 @@ class MainWindow(QMainWindow):
 				TOTAL_ATTACHMENTS_COUNT = 0
 				CONSOLIDATED_IMAGES_COUNT = 0
 				UNIQUE_COPIED_PATHS = set()
+				CREATED_DIRS = set()  # destination dirs already ensured; frames sharing a folder skip the makedirs syscall
 
 				# helper to process a single skin dict (slot -> attachments)
 				def process_skin_dict(skin_dict, skin_name=None, scan_mode=False):
@@ -4835,7 +5523,13 @@ class MainWindow(QMainWindow):
 					nonlocal CONSOLIDATED_IMAGES_COUNT
 					if not isinstance(skin_dict, dict):
 						return skin_dict
-					
+
+					# Per-skin precomputation for the folder-preservation checks:
+					# the lowered name and this skin's owned folders are fixed for
+					# the whole skin, not per attachment.
+					skin_l = skin_name.lower() if skin_name else None
+					owned_folders = {p for p, owners in folder_owners.items() if skin_name in owners} if skin_name else set()
+
 					for slot_name, attachments in list(skin_dict.items()):
 						if not isinstance(attachments, dict):
 
@@ -4857,8 +5551,10 @@ class MainWindow(QMainWindow):
 							# find real source file
 							src = find_source_image(ref, skin_context=skin_name)
 							
-							# DEBUG: Trace consolidation
-							if src and isinstance(src, str):
+							# DEBUG: Trace consolidation (only when debug logging is
+							# on: the abspath/normcase work otherwise runs for
+							# every string attachment)
+							if self.debug and src and isinstance(src, str):
 								fname = os.path.basename(src)
 								if fname in ['clubs.png', 'flipy.png', 'rotator.png', 'ddd.png']:
 									norm_src = os.path.normcase(os.path.abspath(src))
@@ -5207,7 +5903,7 @@ class MainWindow(QMainWindow):
 								continue
 							
 							# determine blend(s) for this slot
-							blend = slot_blend.get(slot_name, 'normal')
+							blend = slot_blend[slot_name]
 							# determine opaque status
 							is_opaque = False
 							
@@ -5215,29 +5911,10 @@ class MainWindow(QMainWindow):
 							if src and optimization_enabled:
 								# src may be a single path or a list of matches; consider all matches opaque to be opaque
 								matches_check = src if isinstance(src, (list, tuple)) else [src]
-								vals = []
-								for m in matches_check:
-									# More robust lookup
-									val = False
-									found_key = False
-									
-									candidates_keys = [
-										m,
-										os.path.normpath(m),
-										os.path.abspath(m),
-										m.lower()
-										# REMOVED: Basename fallback
-										# os.path.basename(m),
-										# os.path.basename(m).lower()
-									]
-									
-									for k in candidates_keys:
-										if k in opaque_map:
-											val = opaque_map[k]
-											found_key = True
-											break
-									
-									vals.append(val)
+								# all() bails at the first transparent frame, so the
+								# remaining lookups are skipped (canonical keys;
+								# basename fallback stays removed to avoid collisions)
+								is_opaque = bool(matches_check) and all(opaque_lookup(m)[1] for m in matches_check)
 							
 							# If attachment appears in slots, collect those slots and their blends
 							# Optimization: use pre-calculated map instead of iterating all skins
@@ -5253,7 +5930,7 @@ class MainWindow(QMainWindow):
 							base_dest = None
 							appears_only_in_non_normal = False
 							if slots_found:
-								appears_only_in_non_normal = all(slot_blend.get(s, 'normal') != 'normal' for s in slots_found)
+								appears_only_in_non_normal = ATTACH_NON_NORMAL_ONLY.get(attach_name, False)
 
 							reason = []
 							is_jpeg_source = False
@@ -5407,21 +6084,9 @@ class MainWindow(QMainWindow):
 								if not self.force_local_cb.isChecked():
 									# 1. Check against known skeletons in the folder
 									if all_skeleton_names and len(parts) > 1:
-										potential_lower = potential_skeleton.lower()
-										# Check exact match, pluralization match, or version-prefix match (symbols_v6 matches symbols)
-										match = None
-										for s in all_skeleton_names:
-											s_lower = s.lower()
-											if s_lower == potential_lower:
-												match = s; break
-											if s_lower.rstrip('s') == potential_lower.rstrip('s'):
-												match = s; break
-											# Version prefix check: skeleton "symbols_v6" matches folder "symbols"
-											if s_lower.startswith(potential_lower):
-												rest = s_lower[len(potential_lower):]
-												if rest and (rest[0] in ['_', '-', 'v', '.'] or rest[0].isdigit()):
-													match = s; break
-													
+										# Exact match, pluralization match, or version-prefix
+										# match (symbols_v6 matches symbols), memoized per folder name
+										match = _match_known_skeleton(potential_skeleton.lower())
 										if match:
 											potential_skeleton = match # Use correct casing
 											is_other_skeleton = True
@@ -5432,7 +6097,7 @@ class MainWindow(QMainWindow):
 									if not is_other_skeleton and len(parts) > 1:
 										IGNORED_ROOTS = ['images', 'common', 'skeleton', 'root', 'private', 'jpeg', 'png', 'assets', 'source', 'reference']
 										# Check against skeleton name with pluralization handling
-										if potential_skeleton.lower().rstrip('s') != skeleton_name.lower().rstrip('s') and potential_skeleton.lower() not in IGNORED_ROOTS:
+										if potential_skeleton.lower().rstrip('s') != skeleton_name_l_sing and potential_skeleton.lower() not in IGNORED_ROOTS:
 											is_other_skeleton = True
 											# Use the folder name as the target skeleton name
 											potential_skeleton = potential_skeleton 
@@ -5451,7 +6116,7 @@ class MainWindow(QMainWindow):
 												for s in all_skeleton_names:
 													s_name = s.lower()
 													# Skip self
-													if s_name == skeleton_name.lower(): continue
+													if s_name == skeleton_name_l: continue
 													
 													# Check if this skeleton name matches any path part
 													# 1. Exact match
@@ -5474,7 +6139,7 @@ class MainWindow(QMainWindow):
 													if is_other_skeleton: break
 								
 								# Apply redirection if detected
-								if is_other_skeleton and potential_skeleton.lower() != skeleton_name.lower():
+								if is_other_skeleton and potential_skeleton.lower() != skeleton_name_l:
 									target_skeleton = potential_skeleton
 									
 									if is_reference:
@@ -5502,7 +6167,7 @@ class MainWindow(QMainWindow):
 									
 									# Also filter out the skeleton name if it appears in the path (e.g. game_intro/reference/...)
 									# Also handle common typos like pluralization (piggy_bank vs piggy_banks)
-									if part_lower == skeleton_name.lower() or part_lower.rstrip('s') == skeleton_name.lower().rstrip('s'):
+									if part_lower == skeleton_name_l or part_lower.rstrip('s') == skeleton_name_l_sing:
 										continue
 
 									if part_lower not in ['jpeg', 'png', 'images', 'symbols', 'skeleton'] and part_lower.rstrip('s') != target_skeleton.lower().rstrip('s'):
@@ -5549,29 +6214,29 @@ class MainWindow(QMainWindow):
 
 								# If this is a skin attachment and the source file was found in a matching skin folder,
 								# we MUST preserve that skin folder in the output to avoid collisions with other skins.
-								if skin_name and skin_name.lower() != 'default' and src:
+								if skin_l and skin_l != 'default' and src:
 									src_check = src[0] if isinstance(src, (list, tuple)) else src
-									src_dir_parts = os.path.dirname(src_check).replace('\\', '/').lower().split('/')
+									src_dir_parts = _dir_parts(src_check)[0]
 									
 									# Check if the source file is in a folder matching the skin name (exact or partial)
 									# OR if the folder is OWNED by the skin (via folder_owners)
 									
 									# 1. Check direct name match
-									if any(skin_name.lower() in p for p in src_dir_parts):
+									if any(skin_l in p for p in src_dir_parts):
 										# Check if we already have the skin name in the nested structure
 										current_nesting = nested_folders_str.lower().split('/') if nested_folders_str else []
-										if skin_name.lower() not in current_nesting:
+										if skin_l not in current_nesting:
 											if nested_folders_str:
 												nested_folders_str = f"{skin_name}/{nested_folders_str}"
 											else:
 												nested_folders_str = skin_name
 									
 									# 2. Check ownership match (e.g. folder "left" owned by skin "pink")
-									elif folder_owners:
+									elif owned_folders:
 										# Iterate in REVERSE to build hierarchy bottom-up (prepending)
 										# This ensures we capture deep nesting like "skin/subfolder" correctly
 										for p in reversed(src_dir_parts):
-											if p in folder_owners and skin_name in folder_owners[p]:
+											if p in owned_folders:
 												# This folder belongs to our skin! Preserve it.
 												# We use the actual folder name (e.g. "left")
 												current_nesting = nested_folders_str.lower().split('/') if nested_folders_str else []
@@ -5598,7 +6263,7 @@ class MainWindow(QMainWindow):
 
 								# Ensure sequence subfolder exists
 								if is_sequence:
-									seq_name = re.sub(r'[_\-]?\d+$', '', base_name)
+									seq_name = _STRIP_SEQ_SUFFIX.sub('', base_name)
 									# Strip trailing underscore so we don't duplicate folder names like "name_" inside "name"
 									seq_name = seq_name.rstrip('_')
 									
@@ -5620,36 +6285,46 @@ class MainWindow(QMainWindow):
 
 								first_rel = None
 								copy_succeeded = False
-								
+
+								# Loop invariants: the nested destination folder and the
+								# export-only flag don't change per match, so compute them once.
+								if nested_folders_str:
+									nested_dest = os.path.join(base_dest, nested_folders_str.replace('/', os.path.sep))
+								else:
+									nested_dest = base_dest
+								export_json_only = self.config.get("json_export_only", False)
+
+								# Throttle the event-loop pump: per-frame processEvents
+								# re-enters Qt for every file of a sequence; ~20Hz keeps
+								# the UI live without draining CPU in event dispatch.
+								last_pump = time.monotonic()
 								for idx, m in enumerate(matches):
 									if self.stop_requested:
 										raise Exception("Process stopped by user")
-									
+
 									# Only process PNG and JPEG files to avoid confusion with junk files (PSD, AEP, etc.)
 									if not m.lower().endswith(('.png', '.jpg', '.jpeg')):
 										continue
-									
-									QApplication.processEvents()
-									
+
+									if time.monotonic() - last_pump > 0.05:
+										QApplication.processEvents()
+										last_pump = time.monotonic()
+
 									# Build destination path with nested folder structure
-									if nested_folders_str:
-										nested_path = nested_folders_str.replace('/', os.path.sep)
-										dst = os.path.join(base_dest, nested_path, os.path.basename(m))
-									else:
-										dst = os.path.join(base_dest, os.path.basename(m))
-									
+									dst = os.path.join(nested_dest, os.path.basename(m))
+
 									# Create parent directories if needed (ONLY if not JSON only export)
-									export_json_only = self.config.get("json_export_only", False)
-									
 									if not export_json_only:
-										try:
-											os.makedirs(os.path.dirname(dst), exist_ok=True)
-										except Exception:
-											pass
+										dst_dir = os.path.dirname(dst)
+										if dst_dir not in CREATED_DIRS:
+											try:
+												os.makedirs(dst_dir, exist_ok=True)
+												CREATED_DIRS.add(dst_dir)
+											except Exception:
+												pass
 									
 									# Copy the file
 									try:
-										import shutil
 										norm_dst = os.path.normpath(dst).lower()
 										
 										# Skip copy if destination already exists/processed in this run
@@ -5657,7 +6332,19 @@ class MainWindow(QMainWindow):
 											copy_succeeded = True
 										else:
 											if not export_json_only:
-												shutil.copy2(m, dst)
+												# Re-runs over the same output: when an identical
+												# frame (size + mtime, which copy2 preserves) is
+												# already at the destination, skip the copy.
+												skip_copy = False
+												try:
+													s_src = os.stat(m)
+													s_dst = os.stat(dst)
+													if s_src.st_size == s_dst.st_size and int(s_src.st_mtime) == int(s_dst.st_mtime):
+														skip_copy = True
+												except OSError:
+													pass
+												if not skip_copy:
+													copy_futures.append((copy_pool.submit(shutil.copy2, m, dst), m, dst))
 											
 											# Mark as succeeded regardless of whether we actually copied or just calculated paths
 											copy_succeeded = True
@@ -5697,7 +6384,7 @@ class MainWindow(QMainWindow):
 											# For sequences: use basename without digits and add trailing underscore
 											# FIX: Handle extension correctly (strip it before regex)
 											s_root, s_ext = os.path.splitext(start_base_name)
-											base_no_digits = re.sub(r"[_\-]?\d+$", "", s_root)
+											base_no_digits = _STRIP_SEQ_SUFFIX.sub("", s_root)
 											
 											# Ensure it ends with underscore for standard sequence prefixing
 											if base_no_digits and not base_no_digits.endswith('_'):
@@ -5777,7 +6464,7 @@ class MainWindow(QMainWindow):
 									
 									# Ensure sequence subfolder exists ONLY for sequences
 									if is_sequence:
-										seq_name = re.sub(r'[_\-]?\d+$', '', base_name)
+										seq_name = _STRIP_SEQ_SUFFIX.sub('', base_name)
 										# Strip trailing underscore so we don't duplicate folder names like "name_" inside "name"
 										seq_name = seq_name.rstrip('_')
 										
@@ -5790,7 +6477,7 @@ class MainWindow(QMainWindow):
 
 									# Extract basename without digits for sequence placeholder
 									if is_sequence:
-										base_no_digits = re.sub(r"\d+$", "", base_name)
+										base_no_digits = _TRAILING_DIGITS.sub("", base_name)
 										if base_no_digits and not base_no_digits.endswith('_'):
 											base_no_digits = base_no_digits + '_'
 									else:
@@ -5817,23 +6504,15 @@ class MainWindow(QMainWindow):
 											if not is_sequence and not os.path.splitext(ph_dst)[1]:
 												ph_dst += ".png"
 
-											os.makedirs(os.path.dirname(ph_dst), exist_ok=True)
+											ph_dir = os.path.dirname(ph_dst)
+											if ph_dir not in CREATED_DIRS:
+												os.makedirs(ph_dir, exist_ok=True)
+												CREATED_DIRS.add(ph_dir)
 											if not os.path.exists(ph_dst):
-												# Try to create a valid transparent PNG (4x4)
-												created = False
-												if Image:
-													try:
-														# Create 4x4 transparent image
-														img = Image.new('RGBA', (4, 4), (0, 0, 0, 0))
-														img.save(ph_dst)
-														created = True
-													except Exception:
-														pass
-												
-												if not created:
-													# Fallback to 1x1 transparent PNG bytes
-													with open(ph_dst, 'wb') as ph:
-														ph.write(b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82')
+												# Write the precomputed transparent PNG bytes;
+												# no need to encode an image per placeholder.
+												with open(ph_dst, 'wb') as ph:
+													ph.write(_PLACEHOLDER_PNG)
 									except Exception:
 										pass
 									# If we created a placeholder file, update stats/sets similarly to a copied file
@@ -5869,19 +6548,13 @@ class MainWindow(QMainWindow):
 						process_skin_dict(temp_skin, scan_mode=True)
 					
 					for f_path, slots in SCAN_SLOT_USAGE.items():
-						is_opaque_f = False
-						candidates = [f_path, os.path.normpath(f_path), os.path.abspath(f_path), f_path.lower()]
-						
-						# Determine opacity from map
-						for k in candidates:
-							if k in opaque_map:
-								is_opaque_f = opaque_map[k]
-								break
+						# Determine opacity from map (canonical keys)
+						is_opaque_f = opaque_lookup(f_path)[1]
 						
 						# Determine slot usage blend
 						appears_only_in_non_normal = True
 						if slots:
-							appears_only_in_non_normal = all(slot_blend.get(s, 'normal') != 'normal' for s in slots)
+							appears_only_in_non_normal = all(slot_blend[s] != 'normal' for s in slots)
 						
 						if appears_only_in_non_normal:
 							dest = 'jpeg'
@@ -5917,39 +6590,40 @@ class MainWindow(QMainWindow):
 				except Exception as e:
 					self.info_panel.append(f"Could not write debug_anims before logic: {e}")
 
-				if isinstance(skins, dict):
-					for skin_name, skin in list(skins.items()):
-						if not isinstance(skin, dict):
-							self.info_panel.append(f"Skipping skin {skin_name}: unexpected type {type(skin)}")
-							continue
-						skins[skin_name] = process_skin_dict(skin, skin_name=skin_name)
-				elif isinstance(skins, list):
-					# preserve list shape: process each element which may be a dict mapping skinName->skinDict or a skinDict directly
-					new_list = []
-					for item in skins:
-						if isinstance(item, dict):
+				# Flatten the skins container once into (container, key, skin,
+				# skin_name) entries so the processing loop runs over a uniform
+				# view; results are written straight back through container[key],
+				# preserving the original dict/list shape without a rebuild.
+				def _normalize_skins(skins_obj):
+					view = []
+					if isinstance(skins_obj, dict):
+						for skin_name, skin in list(skins_obj.items()):
+							if not isinstance(skin, dict):
+								self.info_panel.append(f"Skipping skin {skin_name}: unexpected type {type(skin)}")
+								continue
+							view.append((skins_obj, skin_name, skin, skin_name))
+					elif isinstance(skins_obj, list):
+						for idx, item in enumerate(skins_obj):
+							if not isinstance(item, dict):
+								continue
 							# detect if item is {skinName: {..}} or a skin dict (slot->attachments)
 							# if any value is a dict, treat as mapping skinName->skinDict
 							if any(isinstance(v, dict) for v in item.values()):
-								new_item = {}
 								# Try to find skin name first (for named skin objects)
 								current_skin_name = item.get('name')
-								
 								for k, v in item.items():
 									if isinstance(v, dict):
 										# If k is 'attachments', use current_skin_name
 										# If k is a skin name (in the map case), use k
 										s_name = current_skin_name if k == 'attachments' else k
-										new_item[k] = process_skin_dict(v, skin_name=s_name)
-									else:
-										new_item[k] = v
-								new_list.append(new_item)
+										view.append((item, k, v, s_name))
 							else:
 								# item itself is a skin dict
-								new_list.append(process_skin_dict(item))
-						else:
-							new_list.append(item)
-					j['skins'] = new_list
+								view.append((skins_obj, idx, item, None))
+					return view
+
+				for _container, _key, _skin, _s_name in _normalize_skins(skins):
+					_container[_key] = process_skin_dict(_skin, skin_name=_s_name)
 
 				# Progress update: Sorting and copying done
 				self.progress_bar.setValue(base_progress + 80)
@@ -6069,6 +6743,16 @@ class MainWindow(QMainWindow):
 				else:
 					self.info_panel.append(f"Verifying animations: {len(anims_check)} animations present in data.")
 
+				# join the copy pool: all image data must be on disk (and any
+				# failures logged) before the JSON that references it is written
+				copy_pool.shutdown(wait=True)
+				for fut, c_src, c_dst in copy_futures:
+					try:
+						fut.result()
+					except Exception as e:
+						self.info_panel.append(f"Failed to copy {c_src} -> {c_dst}: {e}")
+				copy_futures = []
+
 				# save modified json into the output root
 				if hasattr(self, 'status_label'): self.status_label.setText(f"Writing JSON: {ui_label_text}")
 				new_json_path = os.path.join(output_root, os.path.splitext(os.path.basename(found_json))[0] + '.json')
@@ -6079,9 +6763,14 @@ class MainWindow(QMainWindow):
 				
 				try:
 					indent_val = 2 if self.config.get("pretty_print_json", True) else None
-					with open(new_json_path, 'w', encoding='utf-8') as nj:
-						# Ensure ensure_ascii=False to support unicode characters without escaping
-						json.dump(j, nj, indent=indent_val, ensure_ascii=False)
+					# Serialize in memory (orjson when available), write once.
+					# orjson emits UTF-8 directly, matching ensure_ascii=False.
+					if orjson is not None:
+						payload = orjson.dumps(j, option=orjson.OPT_INDENT_2 if indent_val else 0)
+					else:
+						payload = json.dumps(j, indent=indent_val, ensure_ascii=False).encode('utf-8')
+					with open(new_json_path, 'wb') as nj:
+						nj.write(payload)
 						nj.flush()
 						os.fsync(nj.fileno())
 					
@@ -6090,7 +6779,7 @@ class MainWindow(QMainWindow):
 					
 					# Double check content on disk
 					with open(new_json_path, 'r', encoding='utf-8') as f_verify:
-						j_verify = json.load(f_verify)
+						j_verify = _jload(f_verify)
 
 						# Run naming + fuzzy spell-check on the temporary JSON (so we catch typos even
 						# when the source was a binary .spine). Merge results into per-file stats.
@@ -6338,8 +7027,20 @@ class MainWindow(QMainWindow):
 						self.info_panel.append(f"Could not open in Spine: {e}")
 		except Exception as e:
 			self.info_panel.append(f"Sorting step failed: {e}")
-
-
+		finally:
+			# Always join the pool: an abort mid-loop (including the
+			# user-requested stop) must not leave queued copies writing into
+			# the output after the run has reported stopped or failed. On the
+			# success path the pool is already down and the futures drained,
+			# so this is a no-op there.
+			if copy_pool is not None:
+				copy_pool.shutdown(wait=True)
+				for fut, c_src, c_dst in copy_futures:
+					try:
+						fut.result()
+					except Exception as e:
+						self.info_panel.append(f"Failed to copy {c_src} -> {c_dst}: {e}")
+				copy_futures = []
 
 
 
@@ -6421,7 +7122,7 @@ class MainWindow(QMainWindow):
 		# List to collect statistics for each file
 		all_file_stats = []
 			
-		file_scanner = FileScanner()
+		file_scanner = FileScanner(self._make_scan_cache_path())
 
 		# Collect all skeleton names from the folder for cross-reference detection
 		all_skeleton_names = []
@@ -6794,6 +7495,29 @@ class MainWindow(QMainWindow):
 			spine_export_unchecked_anims = []
 			try:
 				self.info_panel.append(f"Running export command: {' '.join(cmd)}")
+				# Warm the OS file cache for source-folder images in the
+				# background while Spine exports: the opacity analysis that
+				# follows reads many of these, so the two workloads overlap
+				# instead of running back to back. Gated on the same setting as
+				# that analysis — with optimization off nothing reads these
+				# files, so the full-tree prefetch would be pure wasted I/O.
+				if self.optimization_cb.isChecked():
+					try:
+						def _prefetch_dir(d):
+							for p_root, p_dirs, p_files in os.walk(d):
+								for p_fn in p_files:
+									if p_fn.lower().endswith(_IMG_EXTS):
+										try:
+											with open(os.path.join(p_root, p_fn), 'rb') as pf:
+												while pf.read(1024 * 1024):
+													pass
+										except Exception:
+											pass
+						_prefetch_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+						_prefetch_pool.submit(_prefetch_dir, os.path.dirname(input_path))
+						_prefetch_pool.shutdown(wait=False)
+					except Exception:
+						pass
 				# Use subprocess.run for reliability (avoids buffer deadlocks)
 				# Fix: Force UTF-8 encoding or replacement to avoid Windows codepage errors on binary logs
 				proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding='utf-8', errors='replace')
@@ -6957,7 +7681,7 @@ class MainWindow(QMainWindow):
 								if zf.lower().endswith('.json') and '/' not in zf:
 									try:
 										with z.open(zf) as jf:
-											src_data = json.load(jf)
+											src_data = _jload(jf)
 											if 'animations' in src_data:
 												detected_source_anims.update(src_data['animations'].keys())
 									except:
@@ -7660,6 +8384,12 @@ class MainWindow(QMainWindow):
 		except Exception as e:
 			self.info_panel.append(f"Could not generate report: {e}")
 
+		# Persist the directory listings gathered this run for warm launches
+		try:
+			file_scanner.save()
+		except Exception:
+			pass
+
 		# Check for critical errors (missing files) in stats
 		any_critical = False
 		for stats in all_file_stats:
@@ -28,9 +28,19 @@ try:
 except ImportError:
     Image = None
 
+# --- NumPy Import (optional, vectorized alpha analysis) ---
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # --- Constants ---
 DEFAULT_VERSIONS = ["4.2.43", "4.3", "4.2", "4.1", "4.0", "3.8"]
 
+# Byte-level image-reference pattern: scanning the raw JSON bytes skips the
+# full UTF-8 decode when only the reference strings are needed.
+_IMG_RE_B = re.compile(rb'([\w\-/\\]+\.(?:png|jpg|jpeg|webp))', re.IGNORECASE)
+
 # --- Worker Thread ---
 class SpineWorker(QThread):
     log_signal = Signal(str)
@@ -132,11 +142,17 @@ class SpineWorker(QThread):
             image_refs = self._extract_image_refs(found_json)
             resolved_images = self._resolve_images(image_refs, temp_export_dir, input_folder)
             
+            # Decode is the dominant cost and Pillow releases the GIL in its
+            # codecs, so the per-image checks parallelize well across a pool.
             opaque_map = {}
-            for img_path in resolved_images:
-                is_opaque = self._check_opacity(img_path, opacity_threshold, alpha_cutoff)
-                opaque_map[os.path.normpath(img_path)] = is_opaque
-                opaque_map[os.path.basename(img_path)] = is_opaque
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as ex:
+                results = ex.map(
+                    lambda p: self._check_opacity(p, opacity_threshold, alpha_cutoff),
+                    resolved_images)
+                for img_path, is_opaque in zip(resolved_images, results):
+                    opaque_map[os.path.normpath(img_path)] = is_opaque
+                    opaque_map[os.path.basename(img_path)] = is_opaque
 
             # 4. Sorting & JSON Rebuilding
             skeleton_name = os.path.splitext(name)[0]
@@ -175,11 +191,12 @@ class SpineWorker(QThread):
     def _extract_image_refs(self, json_path):
         refs = set()
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.read(f)
-                # Regex fallback for deep search
-                for m in re.findall(r'([\w\-/\\]+\.(?:png|jpg|jpeg|webp))', data, flags=re.IGNORECASE):
-                    refs.add(m)
+            with open(json_path, 'rb') as f:
+                data = f.read()
+            # Regex fallback for deep search (also fixes the old json.read(f)
+            # typo, which made this method silently return nothing)
+            for m in _IMG_RE_B.findall(data):
+                refs.add(m.decode('utf-8', 'ignore'))
         except: pass
         return refs
 
@@ -199,10 +216,17 @@ class SpineWorker(QThread):
             with Image.open(path) as im:
                 rgba = im.convert('RGBA')
                 alpha = rgba.split()[-1]
-                data = list(alpha.getdata())
-                if not data: return True
-                opaque_count = sum(1 for v in data if v >= cutoff)
-                ratio = opaque_count / len(data)
+                if np is not None:
+                    # Vectorized compare+sum over the raw alpha buffer beats
+                    # materializing millions of Python ints.
+                    arr = np.asarray(alpha, dtype=np.uint8)
+                    if arr.size == 0: return True
+                    ratio = float((arr >= cutoff).sum()) / arr.size
+                else:
+                    data = list(alpha.getdata())
+                    if not data: return True
+                    opaque_count = sum(1 for v in data if v >= cutoff)
+                    ratio = opaque_count / len(data)
                 self.log_signal.emit(f"  - {os.path.basename(path)}: {ratio*100:.1f}% opaque")
                 return ratio >= threshold
         except: return False